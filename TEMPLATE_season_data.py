@@ -22,7 +22,7 @@ SEASON_CONTESTANTS = [
 ]
 
 # PRE-MERGE voting history ONLY
-# Check season_metadata.py for when the merge happens
+# Check data/metadata/US.json for when the merge happens
 SEASON_VOTING_HISTORY = [
     # Episode 1 - FirstOut voted out
     {
@@ -56,8 +56,8 @@ SEASON_VOTING_HISTORY = [
 # - Use first names only (or unique nicknames if there are duplicates)
 # - Match the names exactly across SEASON_CONTESTANTS and votes
 # - Check the wiki for accurate vote counts
-# - Include revotes if they happened (use same episode number)
-# - Don't forget to update season_metadata.py with finalists/winner!
+# - Revotes: "votes" is the deciding round; list every round under "rounds" if you have them
+# - Don't forget to update data/metadata/US.json with finalists/winner!
 
 if __name__ == "__main__":
     print("Survivor Season X: [Name]")
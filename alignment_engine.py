@@ -0,0 +1,384 @@
+"""
+Shared Co-Vote Alignment Engine
+Counts how many times each pair of players voted for the same target
+
+Player names are interned to integer IDs and each tribal council is
+processed as a block with NumPy instead of a Python loop over voter pairs.
+
+By default only each tribal council's deciding "votes" are counted. Passing
+round_weights counts every listed voting round (original vote, revote, ...)
+with a weight per round kind instead.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Hash of this module's source; snapshots counted by other engine code are not reused
+ENGINE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+class PlayerIndex:
+    """Interns player names to consecutive integer IDs."""
+
+    def __init__(self, names=()):
+        self.names = []
+        self.ids = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name):
+        """Return the ID for a name, assigning the next free one if new."""
+        player_id = self.ids.get(name)
+        if player_id is None:
+            player_id = len(self.names)
+            self.ids[name] = player_id
+            self.names.append(name)
+        return player_id
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+
+def tribal_council_pairs(votes, index):
+    """
+    Find the voter pairs that voted for the same target at one tribal council.
+
+    Args:
+        votes: Dictionary of {voter: target} for a single tribal council
+        index: PlayerIndex used to intern voter and target names
+
+    Returns:
+        Tuple (first, second) of ID arrays, one entry per aligned pair, in the
+        same order as a nested loop over the voters would visit them
+    """
+    voters = list(votes.keys())
+    num_voters = len(voters)
+    if num_voters < 2:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    voter_ids = np.fromiter((index.intern(v) for v in voters), dtype=np.intp, count=num_voters)
+    target_ids = np.fromiter((index.intern(votes[v]) for v in voters), dtype=np.intp, count=num_voters)
+
+    # Voters sharing a target form a C(k, 2) block; the upper triangle keeps each pair once
+    rows, cols = np.triu_indices(num_voters, 1)
+    same_target = target_ids[rows] == target_ids[cols]
+    return voter_ids[rows[same_target]], voter_ids[cols[same_target]]
+
+
+def voting_rounds(tribal_council, include_nullified=True):
+    """
+    Return [(round_kind, votes)] for every voting round of a tribal council.
+
+    Councils without a "rounds" list are a single "original" round holding
+    their "votes". With include_nullified=False, votes cancelled by an idol
+    are left out.
+    """
+    rounds = tribal_council.get('rounds')
+    if not rounds:
+        return [('original', tribal_council.get('votes', {}))]
+
+    result = []
+    for voting_round in rounds:
+        votes = voting_round.get('votes', {})
+        nullified = voting_round.get('nullified')
+        if nullified and not include_nullified:
+            nullified = set(nullified)
+            votes = {voter: target for voter, target in votes.items() if voter not in nullified}
+        result.append((voting_round.get('round', 'original'), votes))
+    return result
+
+
+class AlignmentAccumulator:
+    """
+    Running co-vote counts for a season, updated one tribal council at a time.
+
+    Keeps the symmetric player x player count matrix, the set of strong
+    alliance pairs (min_votes or more votes together) and each player's total
+    votes cast with someone else. A snapshot can be saved to disk and restored,
+    so adding a new tribal council only costs the voters at that council.
+
+    round_weights (e.g. {'original': 1, 'revote': 1}) switches from counting
+    the deciding votes to counting every voting round whose kind is listed,
+    each pair adding the round's weight. Non-integer weights give float counts.
+    """
+
+    def __init__(self, min_votes=2, index=None, round_weights=None, include_nullified=True):
+        self.min_votes = min_votes
+        self.index = index if index is not None else PlayerIndex()
+        self.round_weights = dict(round_weights) if round_weights is not None else None
+        self.include_nullified = include_nullified
+        integral = all(float(w).is_integer() for w in (self.round_weights or {}).values())
+        dtype = np.int32 if integral else np.float64
+        self.counts = np.zeros((0, 0), dtype=dtype)
+        self.totals = np.zeros(0, dtype=dtype)
+        self.strong_pairs = set()
+        self.tribal_councils = 0
+        # Chained hash of every tribal council added, used to detect edited history
+        self.fingerprint = ''
+        # Pairs in the order they first voted together, so output order is stable
+        self._first_seen = []
+        # Engine code the counts were made with (ENGINE_VERSION, or '' for old snapshots)
+        self.engine_version = ENGINE_VERSION
+
+    def _ensure_capacity(self):
+        size = len(self.index)
+        capacity = self.counts.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(size, 2 * capacity, 16)
+        grown = np.zeros((new_capacity, new_capacity), dtype=self.counts.dtype)
+        grown[:capacity, :capacity] = self.counts
+        self.counts = grown
+        self.totals = np.concatenate([self.totals, np.zeros(new_capacity - capacity, dtype=self.totals.dtype)])
+
+    def add_tribal_council(self, tribal_council):
+        """Add one tribal council's votes (a SEASON_VOTING_HISTORY entry)."""
+        self.tribal_councils += 1
+        self.fingerprint = chain_fingerprint(self.fingerprint, tribal_council)
+
+        if self.round_weights is None:
+            self._add_votes(tribal_council.get('votes', {}), 1)
+            return
+        for kind, votes in voting_rounds(tribal_council, self.include_nullified):
+            weight = self.round_weights.get(kind)
+            if weight:
+                self._add_votes(votes, weight)
+
+    def _add_votes(self, votes, weight):
+        first, second = tribal_council_pairs(votes, self.index)
+        if first.size == 0:
+            return
+
+        self._ensure_capacity()
+        new_pairs = self.counts[first, second] == 0
+        self._first_seen.extend(zip(first[new_pairs].tolist(), second[new_pairs].tolist()))
+
+        # Voters are unique within a round, so no pair repeats here
+        self.counts[first, second] += weight
+        self.counts[second, first] += weight
+
+        players = np.concatenate([first, second])
+        self.totals += (weight * np.bincount(players, minlength=self.totals.size)).astype(self.totals.dtype)
+
+        # Strong pairs are stored as (lower ID, higher ID) since voter order varies between councils
+        reached = self.counts[first, second] >= self.min_votes
+        low = np.minimum(first[reached], second[reached])
+        high = np.maximum(first[reached], second[reached])
+        self.strong_pairs.update(zip(low.tolist(), high.tolist()))
+
+    def pair_count(self, player1, player2):
+        """Return how many times two players voted together."""
+        if player1 not in self.index or player2 not in self.index:
+            return 0
+        return self.counts[self.index.ids[player1], self.index.ids[player2]].item()
+
+    def _pairs(self, pair_ids):
+        names = self.index.names
+        return {
+            tuple(sorted([names[first], names[second]])): self.counts[first, second].item()
+            for first, second in pair_ids
+        }
+
+    def alignments(self):
+        """
+        Return {(player1, player2): votes_together} for every pair with at least one vote.
+
+        Pair names are sorted alphabetically and pairs are listed in the order
+        they first voted together.
+        """
+        return self._pairs(self._first_seen)
+
+    def iter_alignments(self, min_votes=1):
+        """
+        Yield ((player1, player2), votes_together) strongest first, without building a dict.
+
+        Ties keep the order the pairs first voted together, the same order as
+        sorted(alignments().items(), key=lambda x: x[1], reverse=True).
+        """
+        if not self._first_seen:
+            return
+        pairs = np.array(self._first_seen, dtype=np.intp)
+        counts = self.counts[pairs[:, 0], pairs[:, 1]]
+        names = self.index.names
+        for i in np.argsort(-counts, kind='stable').tolist():
+            count = counts[i].item()
+            if count >= min_votes:
+                first, second = pairs[i].tolist()
+                yield tuple(sorted([names[first], names[second]])), count
+
+    def strong_alliances(self):
+        """Return the alignments with at least min_votes votes together."""
+        return self._pairs(p for p in self._first_seen if (min(p), max(p)) in self.strong_pairs)
+
+    def player_totals(self):
+        """Return {player: votes cast together with another player}."""
+        return {name: self.totals[i].item() for i, name in enumerate(self.index.names) if self.totals[i]}
+
+    def save(self, path):
+        """Write a snapshot of the accumulator to an .npz file."""
+        size = len(self.index)
+        np.savez(
+            path,
+            names=np.array(self.index.names, dtype=str),
+            counts=self.counts[:size, :size],
+            totals=self.totals[:size],
+            first_seen=np.array(self._first_seen, dtype=np.int32).reshape(-1, 2),
+            min_votes=self.min_votes,
+            tribal_councils=self.tribal_councils,
+            fingerprint=self.fingerprint,
+            round_weights=json.dumps(self.round_weights),
+            include_nullified=self.include_nullified,
+            engine_version=self.engine_version,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Restore an accumulator saved with save()."""
+        with np.load(path) as snapshot:
+            # Snapshots from before round weighting only counted the deciding votes
+            round_weights = json.loads(str(snapshot['round_weights'])) if 'round_weights' in snapshot else None
+            include_nullified = bool(snapshot['include_nullified']) if 'include_nullified' in snapshot else True
+            accumulator = cls(min_votes=int(snapshot['min_votes']),
+                              index=PlayerIndex(snapshot['names'].tolist()),
+                              round_weights=round_weights,
+                              include_nullified=include_nullified)
+            accumulator.counts = snapshot['counts'].astype(accumulator.counts.dtype)
+            accumulator.totals = snapshot['totals'].astype(accumulator.totals.dtype)
+            accumulator._first_seen = [tuple(p) for p in snapshot['first_seen'].tolist()]
+            accumulator.tribal_councils = int(snapshot['tribal_councils'])
+            accumulator.fingerprint = str(snapshot['fingerprint'])
+            accumulator.engine_version = str(snapshot['engine_version']) if 'engine_version' in snapshot else ''
+
+        accumulator.strong_pairs = {
+            (min(p), max(p)) for p in accumulator._first_seen
+            if accumulator.counts[p[0], p[1]] >= accumulator.min_votes
+        }
+        return accumulator
+
+
+class EpisodeAlignmentTensor:
+    """
+    Cumulative co-vote counts per episode (episode x player x player).
+
+    Slot 0 is all zeros and slot i holds the counts for every tribal council
+    up to and including the i-th distinct episode, so the counts for any
+    episode range are a single subtraction of two slots.
+    """
+
+    def __init__(self, episodes, names, cumulative):
+        self.episodes = np.asarray(episodes, dtype=np.int32)
+        self.index = PlayerIndex(names)
+        self.cumulative = cumulative
+
+    @classmethod
+    def from_voting_history(cls, voting_history):
+        """Build the tensor from a full list of tribal council dictionaries."""
+        index = PlayerIndex()
+        tribal_council_pairs_by_episode = []
+        for tribal_council in voting_history:
+            first, second = tribal_council_pairs(tribal_council.get('votes', {}), index)
+            tribal_council_pairs_by_episode.append((tribal_council.get('episode', 999), first, second))
+
+        episodes = np.array(sorted({episode for episode, _, _ in tribal_council_pairs_by_episode}), dtype=np.int32)
+        size = len(index)
+        increments = np.zeros((len(episodes) + 1, size, size), dtype=np.int32)
+        for episode, first, second in tribal_council_pairs_by_episode:
+            slot = np.searchsorted(episodes, episode) + 1
+            increments[slot, first, second] += 1
+            increments[slot, second, first] += 1
+
+        cumulative = np.cumsum(increments, axis=0)
+        dtype = np.int16 if cumulative.max(initial=0) <= np.iinfo(np.int16).max else np.int32
+        return cls(episodes, index.names, cumulative.astype(dtype))
+
+    def _slots(self, first_episode=None, last_episode=None):
+        low = 0 if first_episode is None else int(np.searchsorted(self.episodes, first_episode, side='left'))
+        high = len(self.episodes) if last_episode is None else int(np.searchsorted(self.episodes, last_episode, side='right'))
+        return low, max(low, high)
+
+    def window(self, first_episode=None, last_episode=None):
+        """Return the player x player counts for episodes first_episode..last_episode (inclusive)."""
+        low, high = self._slots(first_episode, last_episode)
+        return self.cumulative[high].astype(np.int32) - self.cumulative[low]
+
+    def pair_count(self, player1, player2, first_episode=None, last_episode=None):
+        """Return how many times two players voted together within an episode range."""
+        if player1 not in self.index or player2 not in self.index:
+            return 0
+        first, second = self.index.ids[player1], self.index.ids[player2]
+        low, high = self._slots(first_episode, last_episode)
+        return int(self.cumulative[high, first, second]) - int(self.cumulative[low, first, second])
+
+    def iter_window_alignments(self, first_episode=None, last_episode=None):
+        """
+        Yield ((player1, player2), votes_together) for an episode range, strongest first.
+
+        Ties keep the order of window_alignments(), the same order as
+        sorted(window_alignments().items(), key=lambda x: x[1], reverse=True).
+        """
+        counts = self.window(first_episode, last_episode)
+        rows, cols = np.nonzero(np.triu(counts, 1))
+        values = counts[rows, cols]
+        names = self.index.names
+        for i in np.argsort(-values, kind='stable').tolist():
+            yield tuple(sorted([names[rows[i]], names[cols[i]]])), values[i].item()
+
+    def window_alignments(self, first_episode=None, last_episode=None):
+        """Return {(player1, player2): votes_together} for an episode range."""
+        counts = self.window(first_episode, last_episode)
+        rows, cols = np.nonzero(np.triu(counts, 1))
+        names = self.index.names
+        return {
+            tuple(sorted([names[first], names[second]])): int(counts[first, second])
+            for first, second in zip(rows.tolist(), cols.tolist())
+        }
+
+    def save(self, path):
+        """Write the tensor to an .npz file."""
+        np.savez(path, episodes=self.episodes,
+                 names=np.array(self.index.names, dtype=str),
+                 cumulative=self.cumulative)
+
+    @classmethod
+    def load(cls, path):
+        """Load a tensor saved with save()."""
+        with np.load(path) as tensor:
+            return cls(tensor['episodes'], tensor['names'].tolist(), tensor['cumulative'])
+
+
+def chain_fingerprint(fingerprint, tribal_council):
+    """Extend a chained fingerprint with one tribal council."""
+    payload = json.dumps(tribal_council, sort_keys=True, default=str)
+    return hashlib.sha1((fingerprint + payload).encode('utf-8')).hexdigest()
+
+
+def history_fingerprint(voting_history):
+    """Return the chained fingerprint for a sequence of tribal councils."""
+    fingerprint = ''
+    for tribal_council in voting_history:
+        fingerprint = chain_fingerprint(fingerprint, tribal_council)
+    return fingerprint
+
+
+def calculate_vote_alignments(voting_history, round_weights=None):
+    """
+    Calculate how many times each pair of players voted together.
+
+    Args:
+        voting_history: Iterable of tribal council dictionaries (already filtered)
+        round_weights: Optional {round_kind: weight}; by default only the deciding votes count
+
+    Returns:
+        Dictionary of {(player1, player2): votes_together}
+    """
+    accumulator = AlignmentAccumulator(round_weights=round_weights)
+    for tribal_council in voting_history:
+        accumulator.add_tribal_council(tribal_council)
+    return accumulator.alignments()
@@ -3,38 +3,40 @@ Analyze Season 1 voting data using manual data entry
 This demonstrates the analysis logic without requiring web scraping
 """
 
-from season1_manual_data import SEASON_1_VOTING_HISTORY, FINAL_TRIBAL_COUNCIL, SEASON_1_CONTESTANTS
-from collections import defaultdict
-import json
+import alignment_engine
+import json_stream
+from season_loader import load_season
+from season_results import alignment_entry
 
-def calculate_vote_alignments(voting_history, pre_merge_only=False):
+# Read season 1 as literals rather than importing the module
+season1 = load_season(1)
+SEASON_1_VOTING_HISTORY = season1.voting_history
+SEASON_1_CONTESTANTS = season1.contestants
+FINAL_TRIBAL_COUNCIL = season1.extras['FINAL_TRIBAL_COUNCIL']
+
+def accumulate_vote_alignments(voting_history, pre_merge_only=False):
     """Calculate how many times each pair of players voted together.
 
     Args:
         voting_history: List of tribal council dictionaries
         pre_merge_only: If True, only analyze pre-merge votes
+
+    Returns:
+        AlignmentAccumulator holding the pair counts
     """
-    alignment_counts = defaultdict(int)
+    def selected_tribal_councils():
+        for tribal_council in voting_history:
+            # Skip merge and post-merge votes if pre_merge_only is True
+            if pre_merge_only and tribal_council.get('merge', False):
+                break
+            if pre_merge_only and tribal_council.get('episode', 999) >= 7:
+                continue
+            yield tribal_council
 
-    for tribal_council in voting_history:
-        # Skip merge and post-merge votes if pre_merge_only is True
-        if pre_merge_only and tribal_council.get('merge', False):
-            break
-        if pre_merge_only and tribal_council.get('episode', 999) >= 7:
-            continue
-        votes = tribal_council['votes']
-        voters = list(votes.keys())
-        
-        # For each pair of voters
-        for i, voter1 in enumerate(voters):
-            for voter2 in voters[i+1:]:
-                # Check if they voted for the same person
-                if votes[voter1] == votes[voter2]:
-                    # Create sorted tuple as key (order doesn't matter)
-                    pair = tuple(sorted([voter1, voter2]))
-                    alignment_counts[pair] += 1
-    
-    return alignment_counts
+    accumulator = alignment_engine.AlignmentAccumulator()
+    for tribal_council in selected_tribal_councils():
+        accumulator.add_tribal_council(tribal_council)
+    return accumulator
 
 def analyze_alliances(alignment_counts, min_votes=2):
     """Filter and analyze strong voting alliances."""
@@ -47,7 +49,8 @@ def main():
 
     # Calculate alignments (PRE-MERGE ONLY)
     print("\n1. Calculating vote alignments (Episodes 1-6, before merge)...")
-    alignments = calculate_vote_alignments(SEASON_1_VOTING_HISTORY, pre_merge_only=True)
+    accumulator = accumulate_vote_alignments(SEASON_1_VOTING_HISTORY, pre_merge_only=True)
+    alignments = accumulator.alignments()
 
     # Count pre-merge tribal councils
     pre_merge_tcs = sum(1 for tc in SEASON_1_VOTING_HISTORY if tc.get('episode', 999) < 7)
@@ -90,7 +93,7 @@ def main():
     # Save results
     print("\n5. Saving results...")
     
-    # Convert to list for JSON serialization
+    # Pairs are streamed into the file rather than copied into lists first
     results = {
         "season": 1,
         "season_name": "Borneo",
@@ -100,26 +103,18 @@ def main():
         "contestants": SEASON_1_CONTESTANTS,
         "finalists": finalists,
         "winner": FINAL_TRIBAL_COUNCIL['winner'],
-        "all_alignments": [
-            {
-                "player1": pair[0],
-                "player2": pair[1],
-                "votes_together": count
-            }
-            for pair, count in sorted(alignments.items(), key=lambda x: x[1], reverse=True)
-        ],
-        "strong_alliances": [
-            {
-                "player1": pair[0],
-                "player2": pair[1],
-                "votes_together": count
-            }
+        "all_alignments": (
+            alignment_entry(pair[0], pair[1], count)
+            for pair, count in accumulator.iter_alignments()
+        ),
+        "strong_alliances": (
+            alignment_entry(pair[0], pair[1], count)
             for pair, count in sorted_alliances
-        ]
+        )
     }
     
     with open('season1_analysis_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+        json_stream.dump(results, f, indent=2)
     
     print("   ✓ Saved to season1_analysis_results.json")
     
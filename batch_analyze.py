@@ -2,27 +2,41 @@
 """
 Batch Analysis Script for Multiple Seasons
 Analyzes pre-merge voting patterns for all available season data
+
+Seasons are keyed by (version, season). US seasons 1-20 are analyzed by
+default; --version and --range select other survivoR versions and seasons.
+Outputs for versions other than US go under data/seasons/<VERSION>/.
 """
 
-import json
+import argparse
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
-from season_metadata import get_all_seasons
-import importlib.util
-
-def import_season_data(season_num):
-    """Dynamically import season data module if it exists."""
-    module_path = Path(f"season{season_num}_manual_data.py")
-
-    if not module_path.exists():
-        return None
-
-    spec = importlib.util.spec_from_file_location(f"season{season_num}_data", module_path)
-    if spec and spec.loader:
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    return None
+from season_metadata import DEFAULT_VERSION, get_all_seasons, registry, season_key, season_label
+import alignment_engine
+import build_manifest
+import json_stream
+import results_archive
+import season_loader
+from season_results import SeasonResults, RESULTS_FILE, JSON_FILE, alignment_entry
+
+def import_season_data(season_num, version=DEFAULT_VERSION):
+    """Load a season's data through the season cache if its file exists."""
+    return season_loader.load_season(season_num, version=version)
+
+def season_output_dir(season_num, version=DEFAULT_VERSION, output_dir='data/seasons'):
+    """Directory holding a season's analysis outputs."""
+    return Path(output_dir) / season_loader.season_dir_name(season_num, version)
+
+def pre_merge_tribal_councils(voting_history, merge_episode):
+    """Yield tribal councils up to (not including) the merge episode."""
+    for tribal_council in voting_history:
+        # Only analyze pre-merge votes
+        episode = tribal_council.get('episode', 999)
+        if episode >= merge_episode:
+            break
+        yield tribal_council
 
 def calculate_vote_alignments(voting_history, merge_episode):
     """
@@ -32,40 +46,71 @@ def calculate_vote_alignments(voting_history, merge_episode):
         voting_history: List of tribal council dictionaries
         merge_episode: Episode number when merge occurred
     """
-    alignment_counts = defaultdict(int)
+    return alignment_engine.calculate_vote_alignments(
+        pre_merge_tribal_councils(voting_history, merge_episode))
 
-    for tribal_council in voting_history:
-        # Only analyze pre-merge votes
-        episode = tribal_council.get('episode', 999)
-        if episode >= merge_episode:
-            break
+def update_alignment_state(season_num, voting_history, merge_episode, output_dir='data/seasons',
+                           version=DEFAULT_VERSION, force=False):
+    """
+    Bring a season's saved AlignmentAccumulator up to date with its voting history.
+
+    Only tribal councils added since the last snapshot are counted. If earlier
+    tribal councils were edited, the snapshot was made by different
+    alignment_engine code, or force is set, the snapshot is discarded and
+    rebuilt.
+
+    Args:
+        season_num: Season number
+        voting_history: List of tribal council dictionaries
+        merge_episode: Episode number when merge occurred
+        output_dir: Directory holding the per-season snapshots
+        version: survivoR version the season belongs to
+        force: Recount from scratch even if the snapshot is current
+    """
+    tribal_councils = list(pre_merge_tribal_councils(voting_history, merge_episode))
+    state_file = season_output_dir(season_num, version, output_dir) / "alignment_state.npz"
+
+    accumulator = None
+    if state_file.exists():
+        try:
+            accumulator = alignment_engine.AlignmentAccumulator.load(state_file)
+        except (OSError, ValueError, KeyError):
+            accumulator = None
+
+    if accumulator is not None:
+        done = accumulator.tribal_councils
+        if force or accumulator.engine_version != alignment_engine.ENGINE_VERSION or \
+                done > len(tribal_councils) or \
+                alignment_engine.history_fingerprint(tribal_councils[:done]) != accumulator.fingerprint:
+            accumulator = None
+
+    rebuilt = accumulator is None
+    if rebuilt:
+        accumulator = alignment_engine.AlignmentAccumulator()
 
-        votes = tribal_council.get('votes', {})
-        voters = list(votes.keys())
+    new_tribal_councils = tribal_councils[accumulator.tribal_councils:]
+    for tribal_council in new_tribal_councils:
+        accumulator.add_tribal_council(tribal_council)
 
-        for i, voter1 in enumerate(voters):
-            for voter2 in voters[i+1:]:
-                if votes[voter1] == votes[voter2]:
-                    pair = tuple(sorted([voter1, voter2]))
-                    alignment_counts[pair] += 1
+    if new_tribal_councils or rebuilt:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        accumulator.save(state_file)
 
-    return alignment_counts
+    return accumulator
 
-def analyze_season(season_num, metadata, data_module):
+def analyze_season(season_num, metadata, season_data, version=DEFAULT_VERSION, force=False):
     """Analyze a single season's voting data."""
-    print(f"\nAnalyzing Season {season_num}: {metadata['name']}")
+    print(f"\nAnalyzing {season_label(season_num, version)}: {metadata['name']}")
     print("-" * 60)
 
     # Get voting history from the module
-    voting_history = getattr(data_module, 'SEASON_VOTING_HISTORY',
-                            getattr(data_module, f'SEASON_{season_num}_VOTING_HISTORY', None))
+    voting_history = season_data.voting_history
 
     if not voting_history:
         print(f"  ✗ No voting history found")
         return None
 
-    contestants = getattr(data_module, 'SEASON_CONTESTANTS',
-                         getattr(data_module, f'SEASON_{season_num}_CONTESTANTS', None))
+    contestants = season_data.contestants
 
     # Calculate pre-merge alignments only
     merge_episode = metadata['merge_episode']
@@ -73,8 +118,10 @@ def analyze_season(season_num, metadata, data_module):
 
     print(f"  Pre-merge tribal councils: {pre_merge_tcs}")
 
-    alignments = calculate_vote_alignments(voting_history, merge_episode)
-    strong_alliances = {k: v for k, v in alignments.items() if v >= 2}
+    accumulator = update_alignment_state(season_num, voting_history, merge_episode, version=version,
+                                         force=force)
+    alignments = accumulator.alignments()
+    strong_alliances = accumulator.strong_alliances()
 
     print(f"  Player pairs analyzed: {len(alignments)}")
     print(f"  Strong alliances (2+ votes): {len(strong_alliances)}")
@@ -84,9 +131,11 @@ def analyze_season(season_num, metadata, data_module):
         top_alliance = sorted_alliances[0]
         print(f"  Strongest: {top_alliance[0][0]} ↔ {top_alliance[0][1]} ({top_alliance[1]} votes)")
 
-    # Create results structure
-    results = {
-        "season": season_num,
+    # Create results structure (results without a "version" are US seasons)
+    header = {"season": season_num}
+    if version != DEFAULT_VERSION:
+        header["version"] = version
+    header.update({
         "season_name": metadata['name'],
         "year": metadata['year'],
         "analysis_type": "pre_merge_only",
@@ -96,90 +145,317 @@ def analyze_season(season_num, metadata, data_module):
         "contestants": contestants if contestants else [],
         "finalists": metadata['finalists'],
         "winner": metadata['winner'],
-        "all_alignments": [
-            {
-                "player1": pair[0],
-                "player2": pair[1],
-                "votes_together": count
-            }
-            for pair, count in sorted(alignments.items(), key=lambda x: x[1], reverse=True)
-        ],
-        "strong_alliances": [
-            {
-                "player1": pair[0],
-                "player2": pair[1],
-                "votes_together": count
-            }
-            for pair, count in sorted(strong_alliances.items(), key=lambda x: x[1], reverse=True)
-        ]
-    }
+    })
 
-    return results
+    return SeasonResults.from_alignments(header, header['contestants'], alignments, accumulator.min_votes)
 
-def save_season_results(season_num, results, output_dir='data/seasons'):
-    """Save analysis results for a season."""
-    season_dir = Path(output_dir) / f"season{season_num:02d}"
-    season_dir.mkdir(parents=True, exist_ok=True)
+def save_season_results(season_num, results, output_dir='data/seasons', version=DEFAULT_VERSION,
+                        export_json=False):
+    """
+    Save analysis results for a season.
 
-    output_file = season_dir / "analysis_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    Args:
+        season_num: Season number
+        results: SeasonResults to save as analysis_results.npz
+        output_dir: Directory holding the per-season outputs
+        version: survivoR version the season belongs to
+        export_json: Also write the indented analysis_results.json export
+    """
+    season_dir = season_output_dir(season_num, version, output_dir)
+    season_dir.mkdir(parents=True, exist_ok=True)
 
+    output_file = season_dir / RESULTS_FILE
+    results.save(output_file)
     print(f"  ✓ Saved to {output_file}")
+
+    if export_json:
+        json_file = season_dir / JSON_FILE
+        results.write_json(json_file)
+        print(f"  ✓ Exported {json_file}")
     return output_file
 
-def main():
-    """Main execution function."""
-    print("🏝️  SURVIVOR BATCH ANALYSIS - PRE-MERGE ALLIANCES")
-    print("Analyzing Seasons 1-20")
-    print("=" * 70)
+def season_windows(metadata, extra_windows=()):
+    """
+    Episode windows to report for a season.
 
-    seasons = get_all_seasons(1, 20)
-    results_summary = []
+    Args:
+        metadata: Season metadata dictionary
+        extra_windows: Iterable of (first_episode, last_episode) ranges requested by the user
+    """
+    merge_episode = metadata['merge_episode']
+    windows = [
+        ('pre_merge', None, merge_episode - 1),
+        ('post_merge', merge_episode, None),
+    ]
+    for first_episode, last_episode in extra_windows:
+        windows.append((f"episodes_{first_episode}-{last_episode}", first_episode, last_episode))
+    return windows
+
+def save_season_windows(season_num, voting_history, windows, output_dir='data/seasons', version=DEFAULT_VERSION):
+    """
+    Build the season's per-episode alignment tensor and save window alignments.
+
+    Each window is answered from the cumulative tensor with one subtraction,
+    so adding windows does not rescan the voting history.
+    """
+    season_dir = season_output_dir(season_num, version, output_dir)
+    season_dir.mkdir(parents=True, exist_ok=True)
+
+    tensor = alignment_engine.EpisodeAlignmentTensor.from_voting_history(voting_history)
+    tensor.save(season_dir / "alignment_tensor.npz")
+
+    def window_entries():
+        # Each window's pairs are written out as they are produced
+        for name, first_episode, last_episode in windows:
+            yield {
+                "name": name,
+                "first_episode": first_episode,
+                "last_episode": last_episode,
+                "alignments": (
+                    alignment_entry(pair[0], pair[1], count)
+                    for pair, count in tensor.iter_window_alignments(first_episode, last_episode)
+                )
+            }
+
+    window_results = {
+        "season": season_num,
+        "episodes": tensor.episodes.tolist(),
+        "windows": window_entries()
+    }
 
-    for season_num in sorted(seasons.keys()):
-        metadata = seasons[season_num]
+    output_file = season_dir / "alignment_windows.json"
+    with open(output_file, 'w') as f:
+        json_stream.dump(window_results, f, indent=2)
 
-        # Try to import season data
-        data_module = import_season_data(season_num)
+    print(f"  ✓ Saved {len(windows)} episode windows to {output_file}")
+    return output_file
 
-        if not data_module:
-            print(f"\n✗ Season {season_num}: {metadata['name']} - No data file found")
-            print(f"  Create 'season{season_num}_manual_data.py' to analyze this season")
-            results_summary.append({
+def process_season(season_num, metadata, extra_windows=(), version=DEFAULT_VERSION, export_json=False,
+                   force=False):
+    """Import, analyze and save one season, returning its summary entry."""
+    try:
+        # A season file the loader rejects is reported like any other failure of this season
+        season_data = import_season_data(season_num, version)
+
+        if not season_data:
+            print(f"\n✗ {season_label(season_num, version)}: {metadata['name']} - No data file found")
+            print(f"  Create '{season_loader.season_file(season_num, '.', version)}' to analyze this season")
+            return {
+                'version': version,
                 'season': season_num,
                 'name': metadata['name'],
                 'status': 'no_data'
-            })
-            continue
+            }
 
-        try:
-            results = analyze_season(season_num, metadata, data_module)
+        results = analyze_season(season_num, metadata, season_data, version, force)
 
-            if results:
-                save_season_results(season_num, results)
-                results_summary.append({
-                    'season': season_num,
-                    'name': metadata['name'],
-                    'status': 'success',
-                    'alliances': len(results['strong_alliances'])
-                })
-            else:
-                results_summary.append({
-                    'season': season_num,
-                    'name': metadata['name'],
-                    'status': 'failed'
-                })
-
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            results_summary.append({
+        if results:
+            save_season_results(season_num, results, version=version, export_json=export_json)
+            save_season_windows(season_num, season_data.voting_history,
+                                season_windows(metadata, extra_windows), version=version)
+            return {
+                'version': version,
                 'season': season_num,
                 'name': metadata['name'],
-                'status': 'error'
-            })
+                'status': 'success',
+                'alliances': results.num_strong_alliances
+            }
+        return {
+            'version': version,
+            'season': season_num,
+            'name': metadata['name'],
+            'status': 'failed'
+        }
+
+    except Exception as e:
+        print(f"\n✗ {season_label(season_num, version)}: {metadata['name']} - Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return {
+            'version': version,
+            'season': season_num,
+            'name': metadata['name'],
+            'status': 'error'
+        }
+
+def _process_season_captured(season_num, metadata, extra_windows, version=DEFAULT_VERSION, export_json=False,
+                             force=False):
+    """Run process_season in a worker, returning its summary and printed output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        summary = process_season(season_num, metadata, extra_windows, version, export_json, force)
+    return summary, output.getvalue()
+
+def run_parallel(keys, seasons, extra_windows, jobs, export_json=False, force=False):
+    """
+    Analyze seasons across a process pool.
+
+    Args:
+        keys: List of (version, season_num) to analyze
+        seasons: Dictionary of {(version, season_num): metadata}
+
+    Each worker's output is printed as a block, and the summary is returned in
+    key order. A season whose worker dies is reported as an error without
+    affecting the others.
+    """
+    results_summary = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(_process_season_captured, season_num, seasons[version, season_num], extra_windows,
+                            version, export_json, force)
+            for version, season_num in keys
+        ]
+        for (version, season_num), future in zip(keys, futures):
+            try:
+                summary, output = future.result()
+                print(output, end='')
+            except Exception as e:
+                print(f"\n✗ {season_label(season_num, version)}: worker failed: {e}")
+                summary = {
+                    'version': version,
+                    'season': season_num,
+                    'name': seasons[version, season_num]['name'],
+                    'status': 'error'
+                }
+            results_summary.append(summary)
+    return results_summary
+
+# Source files whose changes invalidate every season's analysis
+ANALYSIS_CODE = [
+    Path(__file__).parent / name
+    for name in ('batch_analyze.py', 'alignment_engine.py', 'season_results.py', 'season_loader.py',
+                 'json_stream.py')
+]
+
+def analysis_inputs(season_num, metadata, extra_windows=(), version=DEFAULT_VERSION, export_json=False):
+    """Hashes of everything the analysis stage reads for a season."""
+    return {
+        'json': export_json,
+        'data': build_manifest.file_hash(season_loader.season_file(season_num, version=version)),
+        'metadata': build_manifest.data_hash(metadata),
+        'code': build_manifest.code_version(ANALYSIS_CODE),
+        'windows': build_manifest.data_hash(extra_windows),
+    }
+
+def analysis_outputs(season_num, output_dir='data/seasons', version=DEFAULT_VERSION, export_json=False):
+    season_dir = season_output_dir(season_num, version, output_dir)
+    outputs = [season_dir / RESULTS_FILE, season_dir / "alignment_windows.json"]
+    if export_json:
+        outputs.append(season_dir / JSON_FILE)
+    return outputs
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Analyze pre-merge voting patterns for all seasons")
+    parser.add_argument(
+        "--window",
+        nargs=2,
+        type=int,
+        action="append",
+        default=[],
+        metavar=("FIRST", "LAST"),
+        help="Also report alignments for episodes FIRST-LAST (repeatable)"
+    )
+    parser.add_argument(
+        "--version",
+        action="append",
+        dest="versions",
+        metavar="VERSION",
+        help="survivoR version to analyze, e.g. US, AU, NZ (repeatable, or 'all'; default: US)"
+    )
+    parser.add_argument(
+        "--range",
+        nargs=2,
+        type=int,
+        default=[1, 20],
+        metavar=("START", "END"),
+        help="Seasons to analyze within each version (default: 1-20)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Analyze seasons in N worker processes (default: 1, serial)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-analyze every season even if its inputs are unchanged"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Also export analysis_results.json next to the compact analysis_results.npz"
+    )
+    return parser.parse_args()
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+
+    versions = args.versions or [DEFAULT_VERSION]
+    if 'all' in versions:
+        versions = registry.versions()
+    start, end = args.range
+
+    print("🏝️  SURVIVOR BATCH ANALYSIS - PRE-MERGE ALLIANCES")
+    print(f"Analyzing Seasons {start}-{end} ({', '.join(versions)})")
+    print("=" * 70)
+
+    seasons = {
+        (version, season_num): metadata
+        for version in versions
+        for season_num, metadata in get_all_seasons(start, end, version).items()
+    }
+
+    manifest = build_manifest.BuildManifest()
+    inputs = {
+        key: analysis_inputs(key[1], seasons[key], args.window, key[0], args.json)
+        for key in seasons
+    }
+
+    # Skip seasons whose data, metadata and analysis code are unchanged since the last run
+    keys = []
+    skipped = {}
+    for version, season_num in sorted(seasons.keys()):
+        key = (version, season_num)
+        if not args.force and inputs[key]['data'] and manifest.is_current(
+                'analyze', season_key(season_num, version), inputs[key]):
+            skipped[key] = {
+                'version': version,
+                'season': season_num,
+                'name': seasons[key]['name'],
+                'status': 'unchanged'
+            }
+        else:
+            keys.append(key)
+
+    if skipped:
+        print(f"\nSkipping {len(skipped)} unchanged season(s) (use --force to re-analyze)")
+
+    if args.jobs > 1:
+        analyzed = run_parallel(keys, seasons, args.window, args.jobs, args.json, args.force)
+    else:
+        analyzed = [process_season(season_num, seasons[version, season_num], args.window, version, args.json,
+                                   args.force)
+                    for version, season_num in keys]
+
+    for item in analyzed:
+        version, season_num = item['version'], item['season']
+        if item['status'] == 'success':
+            manifest.record('analyze', season_key(season_num, version), inputs[version, season_num],
+                            analysis_outputs(season_num, version=version, export_json=args.json))
+        else:
+            manifest.forget('analyze', season_key(season_num, version))
+    manifest.save()
+
+    # Repack the consolidated archive the comparison and dashboard read from
+    if analyzed or not results_archive.ARCHIVE_PATH.exists():
+        archived = results_archive.build_archive()
+        print(f"\n✓ Archived {len(archived)} season(s) to {results_archive.ARCHIVE_PATH}")
+
+    results_summary = sorted(analyzed + list(skipped.values()),
+                             key=lambda item: (item['version'], item['season']))
 
     # Print summary
     print("\n" + "=" * 70)
@@ -190,18 +466,23 @@ def main():
         season_num = item['season']
         name = item['name']
         status = item['status']
+        prefix = '' if item['version'] == DEFAULT_VERSION else f"{item['version']} "
 
         if status == 'success':
             alliances = item.get('alliances', 0)
-            print(f"✓ Season {season_num:2d} - {name:30s} | {alliances} strong alliances")
+            print(f"✓ {prefix}Season {season_num:2d} - {name:30s} | {alliances} strong alliances")
         elif status == 'no_data':
-            print(f"○ Season {season_num:2d} - {name:30s} | No data file")
+            print(f"○ {prefix}Season {season_num:2d} - {name:30s} | No data file")
+        elif status == 'unchanged':
+            print(f"○ {prefix}Season {season_num:2d} - {name:30s} | Unchanged (skipped)")
         else:
-            print(f"✗ Season {season_num:2d} - {name:30s} | {status}")
+            print(f"✗ {prefix}Season {season_num:2d} - {name:30s} | {status}")
 
     success_count = sum(1 for s in results_summary if s['status'] == 'success')
     print("\n" + "=" * 70)
     print(f"Successfully analyzed: {success_count}/{len(results_summary)} seasons")
+    if skipped:
+        print(f"Unchanged and skipped: {len(skipped)}/{len(results_summary)} seasons")
     print("=" * 70)
 
 if __name__ == "__main__":
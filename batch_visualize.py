@@ -2,64 +2,93 @@
 """
 Batch Visualization Script for Multiple Seasons
 Creates network diagrams for all analyzed seasons
+
+US seasons render to visualizations/seasonNN/; other survivoR versions
+render to visualizations/<VERSION>/seasonNN/. --version limits the run to
+some versions.
 """
 
-import json
-import numpy as np
-import networkx as nx
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
+import argparse
+import contextlib
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-def load_season_results(season_num, data_dir='data/seasons'):
-    """Load analysis results for a season."""
-    results_file = Path(data_dir) / f"season{season_num:02d}" / "analysis_results.json"
-
-    if not results_file.exists():
-        return None
-
-    with open(results_file, 'r') as f:
-        return json.load(f)
-
-def identify_starting_tribes(season_num):
-    """Identify which starting tribe each contestant was on."""
-    from season_metadata import get_season_info
-    import importlib.util
-    from pathlib import Path
-
-    # Import season data
-    module_path = Path(f"season{season_num}_manual_data.py")
-    if not module_path.exists():
-        return {}
-
-    spec = importlib.util.spec_from_file_location(f"season{season_num}_data", module_path)
-    if not spec or not spec.loader:
+import build_manifest
+import dashboard
+import image_tiers
+from layout_cache import cached_layout
+from season_loader import season_dir_name
+from results_archive import ResultsArchive
+from season_results import load_results
+from season_metadata import DEFAULT_VERSION, season_key, season_label
+
+# Source files whose changes invalidate every rendered season
+RENDER_CODE = [
+    Path(__file__).parent / name
+    for name in ('batch_visualize.py', 'layout_cache.py', 'force_layout.py', 'plotly_edges.py', 'dashboard.py',
+                 'image_tiers.py')
+]
+
+def load_season_results(season_num, data_dir='data/seasons', version=DEFAULT_VERSION):
+    """Load a season's compact analysis results (SeasonResults), or None."""
+    return load_results(Path(data_dir) / season_dir_name(season_num, version))
+
+def identify_starting_tribes(season_num, version=DEFAULT_VERSION):
+    """
+    Identify which starting tribe each contestant was on.
+
+    A season file that cannot be read gives {} (an unseeded layout) rather
+    than stopping the run; its analysis results can still be drawn.
+    """
+    from season_loader import load_season
+
+    try:
+        season_data = load_season(season_num, version=version)
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"    ⚠ {season_label(season_num, version)}: could not read starting tribes ({e})")
         return {}
-
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    voting_history = getattr(module, 'SEASON_VOTING_HISTORY',
-                            getattr(module, f'SEASON_{season_num}_VOTING_HISTORY', None))
-
-    if not voting_history:
+    if not season_data or not season_data.voting_history:
         return {}
 
     # Map contestants to their starting tribes based on early votes
-    contestant_tribes = {}
-
-    for tribal_council in voting_history[:4]:  # Look at first few tribal councils
-        tribe = tribal_council.get('tribe', 'Unknown')
-        votes = tribal_council.get('votes', {})
-
-        for voter in votes.keys():
-            if voter not in contestant_tribes:
-                contestant_tribes[voter] = tribe
-
-    return contestant_tribes
+    return season_data.starting_tribes(num_tribal_councils=4)
+
+def render_inputs(season_num, results_hash, version=DEFAULT_VERSION, standalone_html=False, print_format='png'):
+    """
+    Hashes of everything the render stage reads for a season.
+
+    A season's images depend on its results, its starting tribes (which seed
+    the layout), the renderer code and the render options.
+    """
+    return {
+        'results': results_hash,
+        'tribes': build_manifest.data_hash(identify_starting_tribes(season_num, version)),
+        'code': build_manifest.code_version(RENDER_CODE),
+        'standalone_html': standalone_html,
+        'print_format': print_format,
+    }
+
+def load_renderers():
+    """
+    Import matplotlib (Agg backend), networkx and plotly.
+
+    The renderers import them on first use, so a run with nothing to render
+    never pays for them; workers and the watch mode call this up front.
+    """
+    import importlib
+
+    import matplotlib.pyplot as plt
+
+    plt.switch_backend('Agg')
+    # Imported for their start-up cost only; the renderers import them again by name
+    for module in ('networkx', 'plotly.graph_objects'):
+        importlib.import_module(module)
 
 def create_network_graph(data, min_votes=1):
-    """Create NetworkX graph from alliance data."""
+    """Create NetworkX graph from alliance data (SeasonResults)."""
+    import networkx as nx
+
     G = nx.Graph()
 
     # Add nodes
@@ -69,19 +98,27 @@ def create_network_graph(data, min_votes=1):
         G.add_node(contestant, finalist=is_finalist, winner=is_winner)
 
     # Add edges for ALL voting alignments (including single votes)
-    for alliance in data['all_alignments']:
-        if alliance['votes_together'] >= min_votes:
-            G.add_edge(alliance['player1'], alliance['player2'],
-                      weight=alliance['votes_together'])
+    for player1, player2, votes_together in data.alignments(min_votes):
+        G.add_edge(player1, player2, weight=votes_together)
 
     return G
 
-def visualize_season(season_num, data, output_dir='visualizations'):
-    """Create visualization for a single season."""
-    print(f"\n  Creating visualizations for Season {season_num}: {data['season_name']}")
+def visualize_season(season_num, data, output_dir='visualizations', standalone_html=False, print_format='png'):
+    """
+    Create visualization for a single season.
+
+    Writes the static image tiers (thumbnail, web PNG and, unless print_format
+    is 'none', the print PNG or SVG) and the dashboard graph payload;
+    standalone_html also writes a self-contained seasonNN_interactive.html.
+    """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    version = data.get('version', DEFAULT_VERSION)
+    print(f"\n  Creating visualizations for {season_label(season_num, version)}: {data['season_name']}")
 
     # Create season subdirectory
-    season_dir = Path(output_dir) / f"season{season_num:02d}"
+    season_dir = Path(output_dir) / season_dir_name(season_num, version)
     season_dir.mkdir(parents=True, exist_ok=True)
 
     # Create network graph
@@ -89,11 +126,12 @@ def visualize_season(season_num, data, output_dir='visualizations'):
 
     if G.number_of_edges() == 0:
         print(f"    ⚠ No alliances to visualize (no edges)")
-        return
+        return []
 
     # Create matplotlib visualization
     fig, ax = plt.subplots(figsize=(16, 12))
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    # Start each tribe in its own cluster so cross-tribe alliances stand out
+    pos = cached_layout(G, k=2, iterations=50, seed=42, tribes=identify_starting_tribes(season_num, version))
 
     # Node styling - Emphasize Final Tribal Council participants
     node_colors = []
@@ -155,7 +193,7 @@ def visualize_season(season_num, data, output_dir='visualizations'):
 
     # Title with Final Tribal Council info
     finalists_str = " & ".join(data['finalists'])
-    title = f"Survivor Season {data['season']}: {data['season_name']} - PRE-MERGE ONLY\n"
+    title = f"Survivor {season_label(data['season'], version)}: {data['season_name']} - PRE-MERGE ONLY\n"
     title += f"Voting Alignment Network (all pre-merge votes)\n"
     title += f"Final Tribal Council: {finalists_str}"
     ax.set_title(title, fontsize=18, fontweight='bold', pad=20)
@@ -188,8 +226,8 @@ def visualize_season(season_num, data, output_dir='visualizations'):
              framealpha=0.95, title='Legend', title_fontsize=11)
 
     # Stats at bottom
-    total_alignments = len(data['all_alignments'])
-    strong_alliances = len(data['strong_alliances'])
+    total_alignments = data.num_alignments
+    strong_alliances = data.num_strong_alliances
     single_votes = total_alignments - strong_alliances
 
     stats_text = f"Contestants: {len(data['contestants'])} | "
@@ -203,50 +241,44 @@ def visualize_season(season_num, data, output_dir='visualizations'):
     ax.axis('off')
     plt.tight_layout()
 
-    # Save
-    png_path = season_dir / f"season{season_num:02d}_alliances.png"
-    plt.savefig(png_path, dpi=300, bbox_inches='tight', facecolor='white')
+    # Save every image tier from the one figure
+    images = image_tiers.save_tiers(fig, season_dir / f"season{season_num:02d}_alliances", print_format,
+                                    bbox_inches='tight', facecolor='white')
     plt.close()
 
-    print(f"    ✓ Saved PNG: {png_path}")
+    print(f"    ✓ Saved images: {', '.join(str(path) for path in images.values())}")
 
-    # Create interactive plotly version
-    create_interactive_viz(season_num, data, G, pos, season_dir)
+    # Interactive version: a compact payload for the dashboard, plus the standalone page if asked
+    paths = list(images.values()) + [dashboard.write_graph_payload(data, G, pos, season_dir)]
+    print(f"    ✓ Saved graph: {paths[-1]}")
+    if standalone_html:
+        paths.append(create_interactive_viz(season_num, data, G, pos, season_dir))
+
+    return paths
 
 def create_interactive_viz(season_num, data, G, pos, output_dir):
     """Create interactive plotly visualization."""
-    edge_traces = []
+    import plotly.graph_objects as go
+    import plotly_edges
 
     max_weight = max([G[u][v]['weight'] for u, v in G.edges()]) if G.number_of_edges() > 0 else 1
 
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        weight = G[edge[0]][edge[1]]['weight']
-
+    def line_style(weight):
         # Differentiate single votes from alliances
         if weight == 1:
             # Single vote: thin, dashed, darker gray
-            edge_trace = go.Scatter(
-                x=[x0, x1, None], y=[y0, y1, None],
-                mode='lines',
-                line=dict(width=1.5, color='rgba(100, 100, 100, 0.5)', dash='dash'),
-                hoverinfo='text',
-                text=f'{edge[0]} ↔ {edge[1]}: {weight} vote (not alliance)',
-                showlegend=False
-            )
-        else:
-            # Alliance: thicker, solid, colored by strength
-            edge_trace = go.Scatter(
-                x=[x0, x1, None], y=[y0, y1, None],
-                mode='lines',
-                line=dict(width=1 + (weight / max_weight) * 9,
-                         color=f'rgba(100, 150, 200, {0.3 + (weight / max_weight) * 0.6})'),
-                hoverinfo='text',
-                text=f'{edge[0]} ↔ {edge[1]}: {weight} votes together',
-                showlegend=False
-            )
-        edge_traces.append(edge_trace)
+            return dict(width=1.5, color='rgba(100, 100, 100, 0.5)', dash='dash')
+        # Alliance: thicker, solid, colored by strength
+        return dict(width=1 + (weight / max_weight) * 9,
+                    color=f'rgba(100, 150, 200, {0.3 + (weight / max_weight) * 0.6})')
+
+    def hover_text(player1, player2, weight):
+        if weight == 1:
+            return f'{player1} ↔ {player2}: {weight} vote (not alliance)'
+        return f'{player1} ↔ {player2}: {weight} votes together'
+
+    # One trace per edge weight, with hover text on invisible midpoint markers
+    edge_traces = plotly_edges.edge_traces(G, pos, line_style, hover_text)
 
     # Node trace
     node_x = []
@@ -302,13 +334,13 @@ def create_interactive_viz(season_num, data, G, pos, output_dir):
     fig = go.Figure(data=edge_traces + [node_trace])
 
     finalists_str = " & ".join(data['finalists'])
-    strong_alliances = len(data['strong_alliances'])
-    total_alignments = len(data['all_alignments'])
+    strong_alliances = data.num_strong_alliances
+    total_alignments = data.num_alignments
     single_votes = total_alignments - strong_alliances
 
     fig.update_layout(
         title=dict(
-            text=f"Season {data['season']}: {data['season_name']} - PRE-MERGE<br>" +
+            text=f"{season_label(data['season'], data.get('version', DEFAULT_VERSION))}: {data['season_name']} - PRE-MERGE<br>" +
                  f"<sub>Interactive Voting Network | Alliances (2+ votes): {strong_alliances} | Single Votes: {single_votes} | Final: {finalists_str}</sub>",
             x=0.5, xanchor='center', font=dict(size=20)
         ),
@@ -324,28 +356,27 @@ def create_interactive_viz(season_num, data, G, pos, output_dir):
     html_path = output_dir / f"season{season_num:02d}_interactive.html"
     fig.write_html(html_path)
     print(f"    ✓ Saved HTML: {html_path}")
+    return html_path
 
-def create_comparison_summary(seasons_data, output_dir='visualizations'):
-    """Create a summary comparison of all seasons."""
-    print("\n  Creating comparison summary...")
+def create_comparison_summary(summary, output_dir='visualizations'):
+    """
+    Create a summary comparison of all seasons.
 
-    # Create summary data
-    summary = []
-    for data in seasons_data:
-        summary.append({
-            'season': data['season'],
-            'name': data['season_name'],
-            'year': data['year'],
-            'alliances': len(data['strong_alliances']),
-            'winner': data['winner']
-        })
+    Args:
+        summary: Summary rows from the results archive (version, season, name, alliances, ...)
+        output_dir: Directory for seasons_comparison.png
+    """
+    import matplotlib.pyplot as plt
+
+    print("\n  Creating comparison summary...")
 
     # Create bar chart
     fig, ax = plt.subplots(figsize=(14, 8))
 
     seasons = [s['season'] for s in summary]
     alliance_counts = [s['alliances'] for s in summary]
-    names = [f"S{s['season']}: {s['name']}" for s in summary]
+    names = [f"{'' if s['version'] == DEFAULT_VERSION else s['version'] + ' '}S{s['season']}: {s['name']}"
+             for s in summary]
 
     bars = ax.bar(range(len(seasons)), alliance_counts, color='#4A90E2', alpha=0.8)
 
@@ -364,42 +395,156 @@ def create_comparison_summary(seasons_data, output_dir='visualizations'):
     plt.close()
 
     print(f"    ✓ Saved comparison: {summary_path}")
+    return summary_path
+
+def render_season(data, **render_options):
+    """
+    Render one season in a worker process.
+
+    Returns the season's manifest key, output paths, elapsed seconds and the
+    text the renderer printed, so only small values travel back to the parent.
+    """
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        paths = visualize_season(data['season'], data, **render_options)
+    elapsed = time.perf_counter() - start
+    key = season_key(data['season'], data.get('version', DEFAULT_VERSION))
+    return key, [str(p) for p in paths], elapsed, output.getvalue()
+
+def render_parallel(seasons_data, jobs, **render_options):
+    """
+    Render seasons across a process pool, printing each season's output in order.
+
+    render_options are passed on to visualize_season (standalone_html, print_format).
+
+    Returns {season key: output paths}. A season whose worker fails is
+    reported and left out, without affecting the others.
+    """
+    rendered = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=load_renderers) as executor:
+        futures = [executor.submit(render_season, data, **render_options) for data in seasons_data]
+        for data, future in zip(seasons_data, futures):
+            try:
+                key, paths, elapsed, output = future.result()
+            except Exception as e:
+                label = season_label(data['season'], data.get('version', DEFAULT_VERSION))
+                print(f"\n✗ {label}: worker failed: {e}")
+                continue
+            print(output, end='')
+            print(f"    ⏱ Season {key} rendered in {elapsed:.1f}s ({len(paths)} file(s))")
+            rendered[key] = paths
+    return rendered
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create network diagrams for all analyzed seasons")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Render seasons in N worker processes (default: 1, serial)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every season even if its analysis results are unchanged"
+    )
+    parser.add_argument(
+        "--version",
+        action="append",
+        dest="versions",
+        metavar="VERSION",
+        help="Only render this survivoR version, e.g. US, AU (repeatable; default: every analyzed version)"
+    )
+    parser.add_argument(
+        "--standalone-html",
+        action="store_true",
+        help="Also write a self-contained seasonNN_interactive.html per season (embeds plotly.js in each)"
+    )
+    parser.add_argument(
+        "--print-format",
+        choices=image_tiers.PRINT_FORMATS,
+        default="png",
+        help="Print-size image tier: 300-dpi png (default), svg, or none to skip it in quick dev runs"
+    )
+    return parser.parse_args()
 
 def main():
     """Main execution function."""
+    args = parse_args()
+
     print("🎨 SURVIVOR BATCH VISUALIZATION")
     print("Creating network diagrams for all analyzed seasons")
     print("=" * 70)
 
-    # Find all analyzed seasons
-    data_dir = Path('data/seasons')
-    seasons_data = []
+    # Find all analyzed seasons from the archive header; no season payload is read yet
+    archive = ResultsArchive.open_or_build()
+    summary = archive.summary_rows(args.versions)
 
-    for season_dir in sorted(data_dir.glob('season*')):
-        results_file = season_dir / 'analysis_results.json'
-        if results_file.exists():
-            with open(results_file, 'r') as f:
-                data = json.load(f)
-                seasons_data.append(data)
-
-    if not seasons_data:
+    if not summary:
         print("\n✗ No analyzed season data found.")
         print("  Run 'python batch_analyze.py' first to analyze seasons.")
         return
 
-    print(f"\nFound {len(seasons_data)} analyzed season(s)")
+    print(f"\nFound {len(summary)} analyzed season(s)")
 
-    # Visualize each season
-    for data in seasons_data:
-        visualize_season(data['season'], data)
+    code = build_manifest.code_version(RENDER_CODE)
+    render_options = {'standalone_html': args.standalone_html, 'print_format': args.print_format}
+    keys = [season_key(row['season'], row['version']) for row in summary]
+    inputs = {
+        key: render_inputs(row['season'], archive.content_hash(key), row['version'], **render_options)
+        for key, row in zip(keys, summary)
+    }
 
-    # Create comparison if multiple seasons
-    if len(seasons_data) > 1:
-        create_comparison_summary(seasons_data)
+    manifest = build_manifest.BuildManifest()
+
+    # Skip seasons whose analysis results and renderer are unchanged since the last run,
+    # and read only the seasons that need rendering
+    to_render = [
+        archive.read(key) for key in keys
+        if args.force or not manifest.is_current('render', key, inputs[key])
+    ]
+    if len(to_render) < len(summary):
+        print(f"Skipping {len(summary) - len(to_render)} unchanged season(s) (use --force to re-render)")
+
+    # Visualize each season
+    if args.jobs > 1:
+        rendered = render_parallel(to_render, args.jobs, **render_options)
+    else:
+        rendered = {
+            season_key(data['season'], data.get('version', DEFAULT_VERSION)):
+                visualize_season(data['season'], data, **render_options)
+            for data in to_render
+        }
+
+    # One copy of plotly.js for the dashboard in index.html, shared by every season
+    if rendered or not (Path('visualizations') / dashboard.PLOTLY_BUNDLE).exists():
+        dashboard.write_plotly_bundle()
+
+    for key, paths in rendered.items():
+        manifest.record('render', key, inputs[key], paths)
+
+    # Create comparison if multiple seasons (after all workers have finished)
+    if len(summary) > 1:
+        comparison_inputs = {
+            'summary': build_manifest.data_hash(summary),
+            'code': code,
+        }
+        if args.force or not manifest.is_current('render', 'comparison', comparison_inputs):
+            summary_path = create_comparison_summary(summary)
+            manifest.record('render', 'comparison', comparison_inputs, [summary_path])
+
+    manifest.save()
+
+    # Regenerate index.html from every rendered season, not just this run's versions
+    index_path, indexed = dashboard.write_index(archive.summary)
+    print(f"\n  ✓ Indexed {len(indexed)} rendered season(s) in {index_path}")
 
     print("\n" + "=" * 70)
     print(f"✅ BATCH VISUALIZATION COMPLETE!")
-    print(f"   Created visualizations for {len(seasons_data)} season(s)")
+    print(f"   Created visualizations for {len(to_render)} season(s)"
+          f" ({len(summary) - len(to_render)} unchanged)")
     print(f"   Output directory: visualizations/")
     print("=" * 70)
 
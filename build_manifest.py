@@ -0,0 +1,74 @@
+"""
+Build Manifest for the Analysis and Visualization Pipeline
+Records content hashes of each season's inputs so unchanged seasons can be skipped
+
+The manifest lives at data/build_manifest.json and holds, per stage and
+season, the hashes of everything that stage read when it last ran.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+MANIFEST_PATH = Path('data') / 'build_manifest.json'
+
+
+def file_hash(path):
+    """Return the SHA-256 of a file's contents, or None if it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def data_hash(value):
+    """Return the SHA-256 of a JSON-serializable value."""
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def code_version(paths):
+    """Return one hash covering the source files a stage depends on."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode('utf-8'))
+        digest.update((file_hash(path) or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Per-stage, per-season record of input hashes from the last successful run."""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def is_current(self, stage, season_key, inputs):
+        """True if the stage last ran with the same inputs and its outputs still exist."""
+        recorded = self.entries.get(stage, {}).get(str(season_key))
+        if not recorded or recorded.get('inputs') != inputs:
+            return False
+        return all(Path(p).exists() for p in recorded.get('outputs', []))
+
+    def record(self, stage, season_key, inputs, outputs=()):
+        """Remember the inputs a stage just built a season from, and the files it wrote."""
+        self.entries.setdefault(stage, {})[str(season_key)] = {
+            'inputs': inputs,
+            'outputs': [str(p) for p in outputs],
+        }
+
+    def forget(self, stage, season_key):
+        """Drop a season's record so the stage runs again next time."""
+        self.entries.get(stage, {}).pop(str(season_key), None)
+
+    def save(self):
+        """Write the manifest to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
@@ -7,10 +7,10 @@ Collects voting data for multiple seasons (1-10) with pre-merge filtering
 import requests
 from bs4 import BeautifulSoup
 import json
-from collections import defaultdict
 from pathlib import Path
 import time
 from season_metadata import get_all_seasons
+import alignment_engine
 
 def fetch_season_page(season_url, max_retries=3):
     """Fetch the HTML content of a Survivor season wiki page with retry logic."""
@@ -94,19 +94,7 @@ def parse_voting_data(soup, season_num, merge_episode):
 
 def calculate_alignments(voting_history):
     """Calculate how many times each pair voted together."""
-    alignment_counts = defaultdict(int)
-
-    for tribal_council in voting_history:
-        votes = tribal_council.get('votes', {})
-        voters = list(votes.keys())
-
-        for i, voter1 in enumerate(voters):
-            for voter2 in voters[i+1:]:
-                if votes[voter1] == votes[voter2]:
-                    pair = tuple(sorted([voter1, voter2]))
-                    alignment_counts[pair] += 1
-
-    return alignment_counts
+    return alignment_engine.calculate_vote_alignments(voting_history)
 
 def collect_season_data(season_num, metadata, output_dir='data/seasons'):
     """Collect data for a single season."""
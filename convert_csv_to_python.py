@@ -11,8 +11,15 @@ This will create/update:
     - season23_manual_data.py
     - season24_manual_data.py
     - season25_manual_data.py
+
+Streaming mode (any size export, including every survivoR version):
+    python3 convert_csv_to_python.py all_versions_votes.csv --db data/survivor_votes.db
+
+This reads the CSV in chunks and writes straight into the SQLite vote store
+instead of generating .py files, so memory use stays flat.
 """
 
+import argparse
 import csv
 import sys
 from collections import defaultdict
@@ -28,8 +35,20 @@ except ImportError:
     print("Make sure season_metadata.py is in the parent directory")
     SEASONS_METADATA = {}
 
+def csv_int(value, default=None):
+    """Parse an integer CSV field, treating blanks and NA as missing"""
+    if value in (None, '', 'NA'):
+        return default
+    return int(value)
+
 def load_csv_data(csv_path):
-    """Load voting data from CSV file"""
+    """
+    Load voting data from CSV file
+
+    Rows are grouped per tribal council, keyed by (episode, order) where
+    order is survivoR's elimination order, so two boots in one episode stay
+    separate tribal councils.
+    """
     votes_by_season = defaultdict(lambda: defaultdict(list))
 
     with open(csv_path, 'r') as f:
@@ -37,12 +56,29 @@ def load_csv_data(csv_path):
         for row in reader:
             season = int(row['season'])
             episode = int(row['episode'])
-            votes_by_season[season][episode].append(row)
+            order = csv_int(row.get('order'), 0)
+            votes_by_season[season][(episode, order)].append(row)
 
     return votes_by_season
 
+def is_rock_draw(vote):
+    """True if survivoR's vote_event marks this row as part of a rock draw"""
+    return 'rock' in (vote.get('vote_event') or '').lower()
+
 def format_tribal_council(episode_num, votes_data):
-    """Format a single tribal council into Python dict format"""
+    """
+    Format a single tribal council into Python dict format
+
+    "votes" holds the deciding round. When the council went to a revote or
+    had idol-nullified votes, every round is also kept under "rounds" rather
+    than overwriting a voter's earlier vote.
+
+    Round kinds: the first vote_order is "original", a round whose
+    vote_event mentions a rock draw is "rock_draw" and any other later round
+    is "revote". "second_vote" is never emitted: survivoR gives a second
+    elimination at the same council its own order, so it becomes a separate
+    tribal council here (add it by hand under "rounds" if wanted).
+    """
     if not votes_data:
         return None
 
@@ -52,22 +88,47 @@ def format_tribal_council(episode_num, votes_data):
     tribe = first_vote.get('tribe', 'TBD')
     eliminated = first_vote.get('voted_out', 'TBD')
 
-    # Build votes dictionary
-    votes_dict = {}
+    # Build one votes dictionary per round (survivoR's vote_order: 1 = original vote)
+    rounds = defaultdict(dict)
+    nullified = defaultdict(list)
+    rock_draws = set()
     for vote in votes_data:
         voter = vote.get('castaway', '')
         target = vote.get('vote', '')
-        if voter and target:
-            votes_dict[voter] = target
-
+        round_num = csv_int(vote.get('vote_order'), 1)
+        if is_rock_draw(vote):
+            rock_draws.add(round_num)
+        if voter and target and target != 'NA':
+            rounds[round_num][voter] = target
+            if vote.get('nullified', '').upper() == 'TRUE':
+                nullified[round_num].append(voter)
+
+    # A rock draw may have no vote rows of its own, so it still counts as a round
+    round_nums = sorted(set(rounds) | rock_draws)
+    voted_rounds = [r for r in round_nums if rounds.get(r)]
     tribal = {
         'episode': episode_num,
         'day': day,
         'tribe': tribe,
         'eliminated': eliminated,
-        'votes': votes_dict
+        'votes': rounds[voted_rounds[-1]] if voted_rounds else {}
     }
 
+    if len(round_nums) > 1 or nullified:
+        tribal['rounds'] = []
+        for i, round_num in enumerate(round_nums):
+            if round_num in rock_draws:
+                kind = 'rock_draw'
+            else:
+                kind = 'original' if i == 0 else 'revote'
+            voting_round = {
+                'round': kind,
+                'votes': dict(rounds[round_num]),
+            }
+            if nullified[round_num]:
+                voting_round['nullified'] = nullified[round_num]
+            tribal['rounds'].append(voting_round)
+
     return tribal
 
 def format_python_file(season_num, tribal_councils):
@@ -123,25 +184,63 @@ SEASON_VOTING_HISTORY = [
         for voter, target in sorted(tc["votes"].items()):
             content += f'            "{voter}": "{target}",\n'
 
-        content += '        }\n'
+        content += '        },\n'
+
+        # Every round of a revote or idol play
+        if tc.get("rounds"):
+            content += '        "rounds": [\n'
+            for voting_round in tc["rounds"]:
+                content += '            {\n'
+                content += f'                "round": "{voting_round["round"]}",\n'
+                content += '                "votes": {\n'
+                for voter, target in sorted(voting_round["votes"].items()):
+                    content += f'                    "{voter}": "{target}",\n'
+                content += '                },\n'
+                if voting_round.get("nullified"):
+                    nullified = ", ".join(f'"{voter}"' for voter in voting_round["nullified"])
+                    content += f'                "nullified": [{nullified}],\n'
+                content += '            },\n'
+            content += '        ],\n'
+
         content += '    },\n'
 
     content += ''']
 
 # Special cases handled:
 # - Quits/medevacs: Add "quit": True or "medevac": True, use "votes": {}
-# - Ties/revotes: Include only the final vote that eliminated someone
+# - Ties/revotes: "votes" is the final vote that eliminated someone; every round
+#   (and any idol-nullified voters) is listed under "rounds"
 # - Tribe swaps: Continue including votes with new tribe compositions
 '''
 
     return content
 
+def stream_to_store(csv_path, db_path, chunk_size):
+    """Stream a CSV export into the SQLite vote store without building .py files."""
+    import vote_store
+
+    print(f"Streaming voting data from {csv_path} into {db_path} ({chunk_size} rows per chunk)...")
+    conn = vote_store.connect(db_path)
+    with conn:
+        vote_store.import_metadata(conn)
+        seasons = vote_store.import_csv(conn, csv_path, chunk_size=chunk_size)
+
+    versions = sorted({version for version, _ in seasons})
+    votes = conn.execute("SELECT COUNT(*) FROM votes").fetchone()[0]
+    conn.close()
+
+    print(f"\n✓ Imported {len(seasons)} season(s) across {len(versions)} version(s): {', '.join(versions)}")
+    print(f"✓ Vote store now holds {votes} votes")
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 convert_csv_to_python.py seasons_21-25_premerge_votes.csv")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Convert survivoR CSV voting data")
+    parser.add_argument("csv_path", help="CSV exported by extract_voting_data.R")
+    parser.add_argument("--db", help="Stream into this SQLite vote store instead of writing .py files")
+    parser.add_argument("--chunk-size", type=int, default=5000,
+                        help="Rows read per chunk in --db mode (default: 5000)")
+    args = parser.parse_args()
 
-    csv_path = sys.argv[1]
+    csv_path = args.csv_path
 
     if not Path(csv_path).exists():
         print(f"Error: File not found: {csv_path}")
@@ -149,6 +248,10 @@ def main():
         print("  Rscript extract_voting_data.R")
         sys.exit(1)
 
+    if args.db:
+        stream_to_store(csv_path, args.db, args.chunk_size)
+        return
+
     print(f"Loading voting data from {csv_path}...")
     votes_by_season = load_csv_data(csv_path)
 
@@ -160,11 +263,12 @@ def main():
         episodes = votes_by_season[season_num]
         tribal_councils = {}
 
-        for ep_num in sorted(episodes.keys()):
-            votes = episodes[ep_num]
+        for council_key in sorted(episodes.keys()):
+            votes = episodes[council_key]
+            ep_num = council_key[0]
             tc = format_tribal_council(ep_num, votes)
             if tc:
-                tribal_councils[ep_num] = tc
+                tribal_councils[council_key] = tc
 
         print(f"  Found {len(tribal_councils)} pre-merge tribal councils")
 
@@ -183,7 +287,7 @@ def main():
     print("="*60)
     print("\nNext steps:")
     print("  1. Review the generated files for accuracy")
-    print("  2. Verify finalist names match season_metadata.py")
+    print("  2. Verify finalist names match data/metadata/US.json")
     print("  3. Run: python batch_analyze.py")
     print("  4. Run: python batch_visualize.py")
 
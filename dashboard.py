@@ -0,0 +1,146 @@
+"""
+Dashboard Payloads for visualizations/index.html
+Compact per-season graph JSON plus one shared copy of plotly.js
+
+Instead of one self-contained HTML file per season (each embedding all of
+plotly.js), the renderer writes seasonNN_graph.json next to the PNG:
+
+    {"season", "version", "label", "name", "year", "finalists", "winner",
+     "strong_alliances", "single_votes",
+     "nodes": [names], "x": [...], "y": [...], "role": [0 contestant, 1 finalist, 2 winner],
+     "edges": [[node index, node index, votes together], ...]}
+
+index.html loads plotly.min.js once and fetches a season's payload only when
+it is viewed, drawing the same traces as create_interactive_viz.
+
+index.html itself is generated from dashboard_index.html by write_index(),
+with a manifest of the rendered seasons (paths, sizes, render time) inlined,
+so new seasons appear without editing the page.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import image_tiers
+from season_loader import season_dir_name
+from season_metadata import DEFAULT_VERSION, season_key, season_label
+
+GRAPH_FILE = 'season{season:02d}_graph.json'
+IMAGE_STEM = 'season{season:02d}_alliances'
+PLOTLY_BUNDLE = 'plotly.min.js'
+INDEX_TEMPLATE = Path(__file__).parent / 'dashboard_index.html'
+
+# Decimal places kept for node positions (well below a pixel at any zoom the page allows)
+POSITION_DIGITS = 4
+
+
+def graph_payload(data, G, pos):
+    """Compact graph description of a season for the dashboard."""
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    roles = [2 if G.nodes[n].get('winner') else 1 if G.nodes[n].get('finalist') else 0 for n in nodes]
+    version = data.get('version', DEFAULT_VERSION)
+    return {
+        'season': data['season'],
+        'version': version,
+        'label': season_label(data['season'], version),
+        'name': data['season_name'],
+        'year': data['year'],
+        'finalists': data['finalists'],
+        'winner': data['winner'],
+        'strong_alliances': data.num_strong_alliances,
+        'single_votes': data.num_alignments - data.num_strong_alliances,
+        'nodes': nodes,
+        'x': [round(float(pos[n][0]), POSITION_DIGITS) for n in nodes],
+        'y': [round(float(pos[n][1]), POSITION_DIGITS) for n in nodes],
+        'role': roles,
+        'edges': [[index[u], index[v], w] for u, v, w in G.edges(data='weight')],
+    }
+
+
+def write_graph_payload(data, G, pos, season_dir):
+    """Write a season's seasonNN_graph.json; returns its path."""
+    path = Path(season_dir) / GRAPH_FILE.format(season=data['season'])
+    with open(path, 'w') as f:
+        json.dump(graph_payload(data, G, pos), f, separators=(',', ':'))
+    return path
+
+
+def write_plotly_bundle(output_dir='visualizations'):
+    """Write the shared plotly.min.js once (again only when plotly is upgraded); returns its path."""
+    import plotly.offline
+
+    path = Path(output_dir) / PLOTLY_BUNDLE
+    bundle = plotly.offline.get_plotlyjs()
+    if not path.exists() or path.stat().st_size != len(bundle.encode('utf-8')):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(bundle, encoding='utf-8')
+    return path
+
+
+def site_entry(row, output_dir='visualizations'):
+    """
+    Index manifest entry for one rendered season, or None if its files are missing.
+
+    Args:
+        row: Summary row from the results archive (version, season, name, year, ...)
+        output_dir: Directory the site is served from
+    """
+    output_dir = Path(output_dir)
+    season_dir = season_dir_name(row['season'], row['version'])
+    graph = season_dir / GRAPH_FILE.format(season=row['season'])
+    if not (output_dir / graph).exists():
+        return None
+
+    # Whichever image tiers the last render wrote; save_tiers removes a print tier it did not write
+    stem = season_dir / IMAGE_STEM.format(season=row['season'])
+    tiers = image_tiers.tier_paths(stem, 'none')
+    prints = [p for p in (stem.with_suffix('.png'), stem.with_suffix('.svg')) if (output_dir / p).exists()]
+    if prints:
+        tiers['print'] = prints[0]
+    images = {
+        tier: {
+            'path': path.as_posix(),
+            'bytes': (output_dir / path).stat().st_size,
+            'width': image_tiers.image_width(output_dir / path),
+        }
+        for tier, path in tiers.items() if (output_dir / path).exists()
+    }
+    if not images:
+        return None
+    newest = max((output_dir / image['path']).stat().st_mtime for image in images.values())
+
+    return {
+        'key': str(season_key(row['season'], row['version'])),
+        'label': season_label(row['season'], row['version']),
+        'version': row['version'],
+        'season': row['season'],
+        'name': row['name'],
+        'year': row['year'],
+        'images': images,
+        'graph': {'path': graph.as_posix(), 'bytes': (output_dir / graph).stat().st_size},
+        'rendered': time.strftime('%Y-%m-%d %H:%M', time.localtime(newest)),
+    }
+
+
+def write_index(summary, output_dir='visualizations'):
+    """
+    Generate index.html listing every rendered season.
+
+    Args:
+        summary: Summary rows from the results archive, in display order
+        output_dir: Directory holding the rendered seasons
+
+    Returns:
+        (index path, manifest entries)
+    """
+    entries = [entry for entry in (site_entry(row, output_dir) for row in summary) if entry]
+    # One entry per line keeps diffs of the generated page readable
+    manifest = '[\n' + ',\n'.join(f"            {json.dumps(entry)}" for entry in entries) + '\n        ]'
+    html = INDEX_TEMPLATE.read_text(encoding='utf-8').replace('__SEASONS__', manifest.replace('</', '<\\/'))
+
+    path = Path(output_dir) / 'index.html'
+    if not path.exists() or path.read_text(encoding='utf-8') != html:
+        path.write_text(html, encoding='utf-8')
+    return path, entries
@@ -0,0 +1,83 @@
+"""
+Tiered Image Outputs
+Saves a matplotlib figure as a thumbnail, a web-size PNG and a print-size PNG or SVG
+
+    seasonNN_alliances_thumb.png   THUMB_WIDTH pixels wide, for previews
+    seasonNN_alliances_web.png     WEB_DPI, what index.html shows
+    seasonNN_alliances.png         PRINT_DPI (or seasonNN_alliances.svg), for print
+
+The figure is rasterized once at web resolution; the thumbnail is scaled down
+from that raster rather than drawn again. Both are stored with an adaptive
+palette (the charts use few colors), which cuts them to about a third. The
+print tier is optional, so dev runs can skip the slow 300-dpi pass entirely;
+a print image left by an earlier render in another format (or, when the
+tier is skipped, any print image) is removed so it never shows an older graph.
+"""
+
+import io
+from pathlib import Path
+
+from PIL import Image
+
+WEB_DPI = 100
+PRINT_DPI = 300
+THUMB_WIDTH = 480
+WEB_COLORS = 256
+THUMB_COLORS = 128
+
+PRINT_FORMATS = ('png', 'svg', 'none')
+
+
+def tier_paths(stem, print_format='png'):
+    """Return {tier: path} for an image stem such as visualizations/season05/season05_alliances."""
+    stem = Path(stem)
+    paths = {
+        'thumb': stem.with_name(stem.name + '_thumb.png'),
+        'web': stem.with_name(stem.name + '_web.png'),
+    }
+    if print_format != 'none':
+        paths['print'] = stem.with_suffix('.' + print_format)
+    return paths
+
+
+def save_tiers(fig, stem, print_format='png', **savefig_kwargs):
+    """
+    Save a figure in every tier.
+
+    Args:
+        fig: Matplotlib figure
+        stem: Output path without extension
+        print_format: 'png' (PRINT_DPI raster), 'svg' (vector) or 'none' to skip the print tier
+        savefig_kwargs: Extra fig.savefig arguments (bbox_inches, facecolor, ...)
+
+    Returns:
+        {tier: path} of the files written
+    """
+    stem = Path(stem)
+    paths = tier_paths(stem, print_format)
+
+    raster = io.BytesIO()
+    fig.savefig(raster, format='png', dpi=WEB_DPI, **savefig_kwargs)
+    raster.seek(0)
+    with Image.open(raster) as image:
+        image = image.convert('RGB')
+    image.quantize(colors=WEB_COLORS).save(paths['web'], optimize=True)
+    image.thumbnail((THUMB_WIDTH, THUMB_WIDTH * image.height // image.width), Image.LANCZOS)
+    image.quantize(colors=THUMB_COLORS).save(paths['thumb'], optimize=True)
+
+    if print_format == 'png':
+        fig.savefig(paths['print'], dpi=PRINT_DPI, **savefig_kwargs)
+    elif print_format == 'svg':
+        fig.savefig(paths['print'], format='svg', **savefig_kwargs)
+    for fmt in PRINT_FORMATS:
+        if fmt not in ('none', print_format):
+            stem.with_suffix('.' + fmt).unlink(missing_ok=True)
+    return paths
+
+
+def image_width(path):
+    """Pixel width of a PNG (read from its header), or None for vector formats."""
+    if Path(path).suffix != '.png':
+        return None
+    with Image.open(path) as image:
+        return image.width
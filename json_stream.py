@@ -0,0 +1,173 @@
+"""
+Streaming JSON Writer and Reader
+Writes and reads large alignment outputs without holding them in memory
+
+dump() writes a dictionary whose values may be generators: each generator
+is written as a JSON array one element at a time. The text is identical to
+json.dump(obj, f, indent=2), so existing consumers are unaffected.
+
+iter_members() reads a JSON object one top-level member at a time, and
+hands back the members named in stream_arrays as iterators over their
+elements, so a consumer can walk all_alignments without loading the file.
+"""
+
+import json
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789.eE+-'
+
+
+def _is_stream(value):
+    """True for values written element by element (generators and other iterators)."""
+    return not isinstance(value, (dict, list, tuple, str, bytes)) and hasattr(value, '__next__')
+
+
+def _key(key):
+    """Object key as json.dump writes it: str as is, numbers, bools and None as JSON text."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _write_value(f, value, indent, level):
+    if isinstance(value, dict):
+        items = iter(value.items())
+        opener, closer = '{', '}'
+    elif isinstance(value, (list, tuple)) or _is_stream(value):
+        items = iter(value)
+        opener, closer = '[', ']'
+    else:
+        f.write(json.dumps(value))
+        return
+
+    inner = '\n' + ' ' * (indent * (level + 1))
+    first = True
+    for item in items:
+        f.write(opener + inner if first else ',' + inner)
+        first = False
+        if opener == '{':
+            key, item = item
+            f.write(json.dumps(_key(key)) + ': ')
+        _write_value(f, item, indent, level + 1)
+    f.write(opener + closer if first else '\n' + ' ' * (indent * level) + closer)
+
+
+def dump(obj, f, indent=2):
+    """
+    Write obj to a text file, streaming any generator values.
+
+    Args:
+        obj: Dictionary (or list) of JSON values; generators become arrays
+        f: Text file opened for writing
+        indent: Spaces per nesting level, as for json.dump
+    """
+    _write_value(f, obj, indent, 0)
+
+
+class _Scanner:
+    """Buffered reader that decodes one JSON value at a time from a file."""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        if not chunk:
+            self.eof = True
+
+    def peek(self):
+        """Return the next non-whitespace character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._fill()
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of the read buffer")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number cut off by the end of the buffer may continue in the next chunk
+                cut_off = end == len(self.buffer) or (
+                    isinstance(value, (int, float)) and self.buffer[end] in _NUMBER_CHARS)
+                if not cut_off or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array(self):
+        """Yield the elements of the array starting at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+
+def iter_members(f, stream_arrays=()):
+    """
+    Yield (key, value) for each top-level member of a JSON object.
+
+    Members named in stream_arrays are yielded as iterators over their
+    elements; any elements left unread are skipped before the next member.
+
+    Args:
+        f: Text file opened for reading
+        stream_arrays: Keys whose array values are streamed rather than decoded
+    """
+    scanner = _Scanner(f)
+    scanner.expect('{')
+    if scanner.peek() == '}':
+        return
+    while True:
+        key = scanner.value()
+        scanner.expect(':')
+        if key in stream_arrays and scanner.peek() == '[':
+            elements = scanner.array()
+            yield key, elements
+            for _ in elements:
+                pass
+        else:
+            yield key, scanner.value()
+        if scanner.peek() == ',':
+            scanner.pos += 1
+            continue
+        scanner.expect('}')
+        return
+
+
+def iter_array(path, key):
+    """Yield the elements of one top-level array member of a JSON file."""
+    with open(path, 'r') as f:
+        for member, value in iter_members(f, stream_arrays=(key,)):
+            if member == key:
+                yield from value
+                return
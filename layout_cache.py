@@ -0,0 +1,121 @@
+"""
+Layout Position Cache
+Keeps force-directed node positions so unchanged graphs are never laid out twice
+
+Positions are stored in data/cache/layouts/<key>.json, where the key is a
+SHA-256 over the graph's nodes, weighted edges and layout parameters
+(including any tribe seeding or warm-start positions and the layout code
+version), all in sorted order. Misses are laid out with
+force_layout.fruchterman_reingold; once more than MAX_CACHED_LAYOUTS are
+stored, the least recently used ones are removed. Every renderer
+(matplotlib PNG, Plotly HTML) asks this module for positions, so they draw
+the same layout and reruns skip the simulation.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+import force_layout
+
+LAYOUT_CACHE_DIR = Path(__file__).parent / 'data' / 'cache' / 'layouts'
+
+# Hash of the layout code; a change to the simulation or its seeding never reuses old positions
+LAYOUT_VERSION = hashlib.sha256(
+    Path(force_layout.__file__).read_bytes() + Path(__file__).read_bytes()
+).hexdigest()
+
+# Layout files kept on disk; each is a few KB
+MAX_CACHED_LAYOUTS = 1000
+
+# Layouts computed in this process, so several renderers of one graph share a single lookup
+_memory = {}
+
+
+def layout_key(G, params):
+    """Canonical SHA-256 of a graph's nodes, weighted edges and layout parameters."""
+    nodes = sorted(str(node) for node in G.nodes())
+    edges = sorted(
+        sorted([str(a), str(b)]) + [G[a][b].get('weight', 1)]
+        for a, b in G.edges()
+    )
+    canonical = json.dumps({'nodes': nodes, 'edges': edges, 'params': params}, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def initial_positions(nodes, seed, tribes=None, previous=None):
+    """
+    Starting positions for a layout, or None for a plain random start.
+
+    Nodes found in previous (a warm start from an earlier layout) keep those
+    positions; the rest are seeded by starting tribe when tribes is given.
+    """
+    if not tribes and not previous:
+        return None
+    positions = force_layout.tribe_seeded_positions(nodes, tribes or {}, seed)
+    for i, node in enumerate(nodes):
+        if previous and node in previous:
+            positions[i] = previous[node]
+    return positions
+
+
+def prune_layouts(cache_dir=LAYOUT_CACHE_DIR, max_layouts=MAX_CACHED_LAYOUTS):
+    """Remove the least recently used layout files beyond max_layouts."""
+    try:
+        paths = sorted(Path(cache_dir).glob('*.json'), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for path in paths[max_layouts:]:
+            path.unlink()
+    except OSError:
+        pass  # Another process pruned the same file, or the cache is unwritable
+
+
+def cached_layout(G, k=2, iterations=50, seed=42, tribes=None, previous=None,
+                  cache_dir=LAYOUT_CACHE_DIR):
+    """
+    Return {node: array([x, y])} for a graph, computing it only on a cache miss.
+
+    Args:
+        G: NetworkX graph with optional 'weight' edge attributes
+        k, iterations, seed: Layout parameters, as for nx.spring_layout
+        tribes: Optional {node: starting tribe} to cluster tribes in the starting positions
+        previous: Optional {node: (x, y)} from an earlier layout to warm-start from
+        cache_dir: Directory of cached layouts
+    """
+    params = {
+        'engine': LAYOUT_VERSION,
+        'k': k,
+        'iterations': iterations,
+        'seed': seed,
+        'tribes': {str(node): tribe for node, tribe in (tribes or {}).items() if node in G},
+        'previous': {str(node): [float(x), float(y)] for node, (x, y) in (previous or {}).items() if node in G},
+    }
+    key = layout_key(G, params)
+
+    positions = _memory.get(key)
+    path = Path(cache_dir) / f"{key}.json"
+    if positions is None and path.exists():
+        try:
+            with open(path, 'r') as f:
+                positions = json.load(f)
+            os.utime(path)  # Mark as recently used for prune_layouts
+        except (OSError, ValueError):
+            positions = None
+    if positions is None or set(positions) != {str(node) for node in G.nodes()}:
+        nodes = list(G.nodes())
+        layout = force_layout.fruchterman_reingold(
+            force_layout.graph_weights(G, nodes), k=k, iterations=iterations, seed=seed,
+            initial=initial_positions(nodes, seed, tribes, previous))
+        positions = {str(node): [float(x), float(y)] for node, (x, y) in zip(nodes, layout.tolist())}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(positions, f)
+        except OSError:
+            pass  # Unwritable cache: still return the layout
+        prune_layouts(cache_dir)
+    _memory[key] = positions
+
+    return {node: np.array(positions[str(node)]) for node in G.nodes()}
@@ -0,0 +1,50 @@
+"""
+Aggregated Plotly Edge Traces
+Draws a graph's edges with one trace per weight instead of one per edge
+
+Edges sharing a weight share a line style, so each weight becomes a single
+Scatter whose segments are separated by None. Hover text moves to one
+invisible marker trace at the edge midpoints, so a season's HTML carries a
+handful of traces rather than one per co-vote.
+"""
+
+import plotly.graph_objects as go
+
+
+def edge_traces(G, pos, line_style, hover_text):
+    """
+    Build line traces (one per edge weight) plus a midpoint hover trace.
+
+    Args:
+        G: NetworkX graph with 'weight' edge attributes
+        pos: {node: (x, y)} positions
+        line_style: Function weight -> dict of go.Scatter line properties
+        hover_text: Function (player1, player2, weight) -> hover string
+
+    Returns:
+        List of go.Scatter traces, lightest weight first and hover markers last
+    """
+    buckets = {}
+    mid_x, mid_y, texts = [], [], []
+    for u, v, weight in G.edges(data='weight'):
+        (x0, y0), (x1, y1) = pos[u], pos[v]
+        xs, ys = buckets.setdefault(weight, ([], []))
+        xs += [x0, x1, None]
+        ys += [y0, y1, None]
+        mid_x.append((x0 + x1) / 2)
+        mid_y.append((y0 + y1) / 2)
+        texts.append(hover_text(u, v, weight))
+
+    traces = [
+        go.Scatter(x=xs, y=ys, mode='lines', line=line_style(weight), hoverinfo='skip', showlegend=False)
+        for weight, (xs, ys) in sorted(buckets.items())
+    ]
+    traces.append(go.Scatter(
+        x=mid_x, y=mid_y,
+        mode='markers',
+        marker=dict(size=12, opacity=0),
+        hoverinfo='text',
+        text=texts,
+        showlegend=False
+    ))
+    return traces
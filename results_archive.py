@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Consolidated Results Archive for All Seasons
+Packs every season's analysis results into one file with a random-access index
+
+Layout of data/results_archive.bin:
+    magic        b'SVRA'
+    format       uint8 archive format number
+    header size  uint64, little-endian
+    header       JSON object with
+                     summary  one row per season (version, season, name, year,
+                              alliances, winner, tribal_councils)
+                     seasons  {season key: {"offset", "length", "hash"}}
+    payload      each season's compact results (the analysis_results.npz
+                 contents), back to back; offsets are relative to the payload
+
+Reading the summary touches only the header, and reading one season seeks
+straight to its bytes, so the comparison chart and season lookups never
+open the per-season directories.
+
+Usage:
+    python results_archive.py                  # Rebuild from data/seasons/
+    python results_archive.py --summary        # Print the summary block
+    python results_archive.py --season 5       # Print one season's header
+"""
+
+import argparse
+import io
+import json
+import os
+import struct
+from pathlib import Path
+
+from season_metadata import DEFAULT_VERSION, season_key
+from season_results import SeasonResults, find_season_dirs, load_results
+
+ARCHIVE_PATH = Path('data') / 'results_archive.bin'
+
+MAGIC = b'SVRA'
+ARCHIVE_FORMAT = 1
+_PREFIX = struct.Struct('<4sBQ')
+
+
+def summary_row(results):
+    """Per-season fields kept in the archive's summary block."""
+    return {
+        'version': results.get('version', DEFAULT_VERSION),
+        'season': results['season'],
+        'name': results['season_name'],
+        'year': results['year'],
+        'alliances': results.num_strong_alliances,
+        'winner': results['winner'],
+        'tribal_councils': results.get('total_tribal_councils', 0),
+    }
+
+
+def write_archive(season_results, path=ARCHIVE_PATH):
+    """
+    Write SeasonResults objects to one archive file.
+
+    Args:
+        season_results: Iterable of SeasonResults (any order; stored by version, season)
+        path: Archive file to (re)write
+
+    Returns:
+        The summary rows written
+    """
+    ordered = sorted(season_results, key=lambda r: (r.get('version', DEFAULT_VERSION), r['season']))
+    payload = io.BytesIO()
+    summary, seasons = [], {}
+    for results in ordered:
+        buffer = io.BytesIO()
+        results.save(buffer)
+        data = buffer.getvalue()
+        key = str(season_key(results['season'], results.get('version', DEFAULT_VERSION)))
+        seasons[key] = {'offset': payload.tell(), 'length': len(data), 'hash': results.content_hash()}
+        payload.write(data)
+        summary.append(summary_row(results))
+
+    header = json.dumps({'summary': summary, 'seasons': seasons}).encode('utf-8')
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the archive and swap it in, so readers never see a half-written file
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, ARCHIVE_FORMAT, len(header)))
+        f.write(header)
+        f.write(payload.getvalue())
+    os.replace(temp_path, path)
+    return summary
+
+
+def build_archive(data_dir='data/seasons', path=ARCHIVE_PATH):
+    """Rebuild the archive from every season output directory; returns the summary rows."""
+    season_results = [load_results(season_dir) for _, season_dir in find_season_dirs(data_dir)]
+    return write_archive([r for r in season_results if r is not None], path)
+
+
+class ResultsArchive:
+    """
+    Random-access reader for the results archive.
+
+    Opening reads only the header; season payloads are read on demand.
+
+    Args:
+        path: Archive file written by write_archive()
+    """
+
+    def __init__(self, path=ARCHIVE_PATH):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            magic, archive_format, header_size = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != MAGIC or archive_format != ARCHIVE_FORMAT:
+                raise ValueError(f"{self.path} is not a format {ARCHIVE_FORMAT} results archive")
+            header = json.loads(f.read(header_size).decode('utf-8'))
+        self.summary = header['summary']
+        self.seasons = header['seasons']
+        self._payload_start = _PREFIX.size + header_size
+
+    @classmethod
+    def open_or_build(cls, path=ARCHIVE_PATH, data_dir='data/seasons'):
+        """Open the archive, building it from the season directories first if it is missing."""
+        if not Path(path).exists():
+            build_archive(data_dir, path)
+        return cls(path)
+
+    def __len__(self):
+        return len(self.seasons)
+
+    def __contains__(self, key):
+        return str(key) in self.seasons
+
+    def keys(self):
+        """Season keys in archive order (by version, then season)."""
+        return list(self.seasons)
+
+    def summary_rows(self, versions=None):
+        """Return the summary block, optionally limited to some versions."""
+        return [row for row in self.summary if not versions or row['version'] in versions]
+
+    def content_hash(self, key):
+        """Content hash of one season's results, from the header alone."""
+        return self.seasons[str(key)]['hash']
+
+    def read(self, key):
+        """Read one season's SeasonResults without touching the others."""
+        entry = self.seasons[str(key)]
+        with open(self.path, 'rb') as f:
+            f.seek(self._payload_start + entry['offset'])
+            return SeasonResults.load(io.BytesIO(f.read(entry['length'])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the consolidated results archive")
+    parser.add_argument("--path", default=str(ARCHIVE_PATH), help=f"Archive file (default: {ARCHIVE_PATH})")
+    parser.add_argument("--summary", action="store_true", help="Print the summary block instead of rebuilding")
+    parser.add_argument("--season", type=int, help="Print one season's header instead of rebuilding")
+    parser.add_argument("--version", default=DEFAULT_VERSION, help=f"Version for --season (default: {DEFAULT_VERSION})")
+    args = parser.parse_args()
+
+    if args.summary or args.season is not None:
+        archive = ResultsArchive(args.path)
+        if args.season is not None:
+            print(json.dumps(archive.read(season_key(args.season, args.version)).header, indent=2))
+        else:
+            for row in archive.summary:
+                prefix = '' if row['version'] == DEFAULT_VERSION else f"{row['version']} "
+                print(f"{prefix}Season {row['season']:2d} - {row['name']:30s} | "
+                      f"{row['alliances']} strong alliances, {row['tribal_councils']} tribal councils")
+        return
+
+    summary = build_archive(path=args.path)
+    size = Path(args.path).stat().st_size
+    print(f"✓ Archived {len(summary)} season(s): {size / 1024:.1f} KB in {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,7 @@ def generate_season_template(season_num, output_dir="."):
 
     # Get metadata for this season
     if season_num not in SEASONS_METADATA:
-        print(f"❌ Season {season_num} not found in metadata. Add it to season_metadata.py first.")
+        print(f"❌ Season {season_num} not found in metadata. Add it to data/metadata/US.json first.")
         return False
 
     metadata = SEASONS_METADATA[season_num]
@@ -88,7 +88,9 @@ SEASON_VOTING_HISTORY = [
 
 # Special cases to handle:
 # - For quits/medevacs: Add "quit": True or "medevac": True, use "votes": {{}}
-# - For ties/revotes: Include only the final vote that eliminated someone
+# - For ties/revotes: "votes" holds the final vote that eliminated someone; optionally list
+#   every round under "rounds": [{{"round": "original", "votes": {{...}}}}, {{"round": "revote", "votes": {{...}}}}]
+#   (round kinds: original, revote, rock_draw, second_vote; idol-cancelled voters go in "nullified": [...])
 # - Tribe swaps: Continue including votes with new tribe compositions
 '''
 
@@ -12,13 +12,15 @@ Usage:
 """
 
 import argparse
-import importlib
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+import image_tiers
+from dashboard import GRAPH_FILE, IMAGE_STEM
 from season_metadata import SEASONS_METADATA
+from season_loader import load_season
 
 
 def check_season_progress(season_num):
@@ -47,22 +49,23 @@ def check_season_progress(season_num):
         return status
 
     # Check data file exists
-    module_name = f"season{season_num}_manual_data"
     try:
-        season_module = importlib.import_module(module_name)
+        season_data = load_season(season_num)
+        if season_data is None:
+            raise FileNotFoundError(season_num)
         status['file_exists'] = True
 
         # Check contestants list
-        if hasattr(season_module, 'SEASON_CONTESTANTS'):
-            contestants = season_module.SEASON_CONTESTANTS
+        if season_data.has_contestants:
+            contestants = season_data.contestants
             if contestants and len(contestants) > 0:
                 # Check if it's not just empty/placeholder
                 if not all(c == "" or "TODO" in str(c) for c in contestants):
                     status['contestants_filled'] = True
 
         # Check voting history
-        if hasattr(season_module, 'SEASON_VOTING_HISTORY'):
-            voting_history = season_module.SEASON_VOTING_HISTORY
+        if season_data.has_voting_history:
+            voting_history = season_data.voting_history
 
             # Count TCs with actual data (not "TBD" placeholders)
             actual_tcs = 0
@@ -80,20 +83,24 @@ def check_season_progress(season_num):
             if actual_tcs > 0:
                 status['votes_filled'] = True
 
-    except ModuleNotFoundError:
+    except FileNotFoundError:
         pass  # File doesn't exist
     except Exception as e:
         pass  # Import error
 
     # Check analysis results
     season_padded = f"{season_num:02d}"
-    analysis_path = Path(f"data/seasons/season{season_padded}/analysis_results.json")
-    status['analysis_exists'] = analysis_path.exists()
-
-    # Check visualizations
-    viz_png = Path(f"visualizations/season{season_padded}/season{season_padded}_alliances.png")
-    viz_html = Path(f"visualizations/season{season_padded}/season{season_padded}_interactive.html")
-    status['viz_exists'] = viz_png.exists() and viz_html.exists()
+    analysis_dir = Path(f"data/seasons/season{season_padded}")
+    status['analysis_exists'] = (analysis_dir / "analysis_results.npz").exists() or \
+        (analysis_dir / "analysis_results.json").exists()
+
+    # Check visualizations: the dashboard graph plus a web or print image
+    # (the standalone interactive HTML is optional)
+    viz_dir = Path(f"visualizations/season{season_padded}")
+    stem = viz_dir / IMAGE_STEM.format(season=season_num)
+    images = [image_tiers.tier_paths(stem, 'none')['web'], stem.with_suffix('.png'), stem.with_suffix('.svg')]
+    status['viz_exists'] = (viz_dir / GRAPH_FILE.format(season=season_num)).exists() and \
+        any(image.exists() for image in images)
 
     # Calculate overall completion percentage
     if status['expected_tcs'] > 0:
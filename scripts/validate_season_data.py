@@ -12,7 +12,6 @@ Usage:
 """
 
 import argparse
-import importlib
 import sys
 from pathlib import Path
 from collections import Counter
@@ -20,6 +19,7 @@ from collections import Counter
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from season_metadata import SEASONS_METADATA
+from season_loader import load_season
 
 
 class ValidationError:
@@ -80,28 +80,29 @@ def validate_season_data(season_num):
 
     metadata = SEASONS_METADATA[season_num]
 
-    # Try to import the season data module
+    # Load the season data file
     module_name = f"season{season_num}_manual_data"
     try:
-        season_module = importlib.import_module(module_name)
-    except ModuleNotFoundError:
-        errors.append(ValidationError("ERROR", f"Data file {module_name}.py not found"))
-        return errors
+        season_data = load_season(season_num)
     except Exception as e:
         errors.append(ValidationError("ERROR", f"Error importing {module_name}.py: {e}"))
         return errors
 
+    if season_data is None:
+        errors.append(ValidationError("ERROR", f"Data file {module_name}.py not found"))
+        return errors
+
     # Check required attributes exist
-    if not hasattr(season_module, "SEASON_CONTESTANTS"):
+    if not season_data.has_contestants:
         errors.append(ValidationError("ERROR", "Missing SEASON_CONTESTANTS list"))
         return errors
 
-    if not hasattr(season_module, "SEASON_VOTING_HISTORY"):
+    if not season_data.has_voting_history:
         errors.append(ValidationError("ERROR", "Missing SEASON_VOTING_HISTORY list"))
         return errors
 
-    contestants = season_module.SEASON_CONTESTANTS
-    voting_history = season_module.SEASON_VOTING_HISTORY
+    contestants = season_data.contestants
+    voting_history = season_data.voting_history
 
     # Check contestants list is populated
     if not contestants:
@@ -203,6 +204,31 @@ def validate_season_data(season_num):
                     f"{tc_label} (Ep {episode}): Vote target '{target}' not in SEASON_CONTESTANTS"
                 ))
 
+        # Validate the optional list of voting rounds
+        rounds = tc.get("rounds", [])
+        for round_idx, voting_round in enumerate(rounds):
+            # Unknown round kinds and keys are rejected by load_season (reported above as an import error)
+            round_label = f"{tc_label} (Ep {episode}) round {round_idx + 1}"
+            round_votes = voting_round.get("votes", {})
+            for voter, target in round_votes.items():
+                for role, name in (("Voter", voter), ("Vote target", target)):
+                    if name not in contestants and name != "TBD":
+                        errors.append(ValidationError(
+                            "ERROR", f"{round_label}: {role} '{name}' not in SEASON_CONTESTANTS"
+                        ))
+            for voter in voting_round.get("nullified", []):
+                if voter not in round_votes:
+                    errors.append(ValidationError(
+                        "ERROR", f"{round_label}: Nullified voter '{voter}' has no vote in this round"
+                    ))
+
+        voting_rounds = [r.get("votes") for r in rounds if r.get("votes")]
+        if voting_rounds and voting_rounds[-1] != votes:
+            errors.append(ValidationError(
+                "WARNING",
+                f"{tc_label} (Ep {episode}): 'votes' doesn't match the last voting round in 'rounds'"
+            ))
+
         # Check eliminated player received most votes (if not TBD)
         if eliminated and eliminated != "TBD" and votes:
             vote_counts = Counter(votes.values())
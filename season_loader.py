@@ -0,0 +1,417 @@
+"""
+Season Data Loader
+Reads seasonN_manual_data.py files once and caches them in a compact form
+
+Season files are parsed as literals with ast, never imported or executed,
+so contributed files are safe to load (e.g. in CI).
+
+Each season is normalized into integer-coded arrays (a string table for
+player names, one row per tribal council and one row per vote) and stored
+under data/cache/seasons/. The cache entry is reused while the source file's
+mtime is unchanged, or while its content hash still matches after a touch.
+
+US season files live in the repository root; other survivoR versions are
+partitioned under versions/<VERSION>/, with matching cache subdirectories.
+
+A tribal council may also list every voting round under "rounds" (original
+vote, revote, rock draw, a second vote at the same council), each with its
+own votes, nullified voters and eliminated player. "votes" stays the
+deciding round, so code that only reads "votes" is unaffected.
+"""
+
+import ast
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from season_metadata import DEFAULT_VERSION
+
+SEASON_DIR = Path(__file__).parent
+CACHE_DIR = SEASON_DIR / 'data' / 'cache' / 'seasons'
+
+# Bump when the cached layout changes so old entries are rebuilt
+CACHE_FORMAT = 3
+
+# Tribal council keys stored as arrays; anything else is kept in the per-council extras
+CORE_KEYS = ('episode', 'day', 'tribe', 'eliminated', 'votes', 'rounds')
+
+# Kinds of voting round, stored as their index in this tuple
+ROUND_KINDS = ('original', 'revote', 'rock_draw', 'second_vote')
+ROUND_KEYS = ('round', 'votes', 'nullified', 'eliminated')
+
+NO_VALUE = -1
+
+# Season file extras that other modules read (e.g. analyze_season1_manual.py)
+CONSUMED_EXTRAS = ('FINAL_TRIBAL_COUNCIL',)
+
+
+def season_file(season_num, season_dir=SEASON_DIR, version=DEFAULT_VERSION):
+    """Path of a season's manual data file."""
+    season_dir = Path(season_dir)
+    if version != DEFAULT_VERSION:
+        season_dir = season_dir / 'versions' / version
+    return season_dir / f"season{season_num}_manual_data.py"
+
+
+def season_dir_name(season_num, version=DEFAULT_VERSION):
+    """Relative directory for a season's outputs: seasonNN for US, VERSION/seasonNN otherwise."""
+    name = Path(f"season{season_num:02d}")
+    return name if version == DEFAULT_VERSION else Path(version) / name
+
+
+def read_literal_assignments(path, required=None):
+    """
+    Return {NAME: value} for every top-level UPPERCASE assignment of a literal.
+
+    The file is parsed with ast and each value is read with ast.literal_eval,
+    so nothing in it is executed or imported. Statements that are not literal
+    assignments (docstrings, `if __name__ == "__main__":` blocks) are skipped.
+
+    Args:
+        path: Python file to read
+        required: Optional function NAME -> bool. A non-literal value raises
+            ValueError only for names it accepts; others are skipped with a
+            warning. By default every UPPERCASE name must be a literal.
+    """
+    tree = ast.parse(Path(path).read_text(encoding='utf-8'), filename=str(path))
+    assignments = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target, value = node.targets[0], node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target, value = node.target, node.value
+        else:
+            continue
+        if not isinstance(target, ast.Name) or not target.id.isupper():
+            continue
+        try:
+            assignments[target.id] = ast.literal_eval(value)
+        except (ValueError, TypeError, SyntaxError, RecursionError):
+            message = f"{path}:{node.lineno}: {target.id} is not a plain literal"
+            if required is None or required(target.id):
+                raise ValueError(message) from None
+            print(f"⚠ {message}; skipping it")
+    return assignments
+
+
+def read_season_module(season_num, path):
+    """
+    Read a season file and return its (contestants, voting_history, extras).
+
+    Accepts both SEASON_CONTESTANTS / SEASON_VOTING_HISTORY and the
+    SEASON_{n}_ spelling used by season 1. Missing lists are returned as None.
+    Only SEASON_* names and CONSUMED_EXTRAS must be literals; any other
+    UPPERCASE name that is not is left out of extras.
+    """
+    assignments = read_literal_assignments(
+        path, required=lambda name: name.startswith('SEASON_') or name in CONSUMED_EXTRAS)
+
+    contestants_names = ('SEASON_CONTESTANTS', f'SEASON_{season_num}_CONTESTANTS')
+    history_names = ('SEASON_VOTING_HISTORY', f'SEASON_{season_num}_VOTING_HISTORY')
+
+    contestants = next((assignments[n] for n in contestants_names if n in assignments), None)
+    voting_history = next((assignments[n] for n in history_names if n in assignments), None)
+    extras = {
+        name: value for name, value in assignments.items()
+        if name not in contestants_names + history_names
+    }
+    return contestants, voting_history, extras
+
+
+def lookup(value, table):
+    """Decode an integer code back to its string (None for NO_VALUE)."""
+    return None if value == NO_VALUE else table[value]
+
+
+def literal_text(value):
+    """
+    repr() of a season file literal, checked to read back equal with ast.literal_eval.
+
+    Raises ValueError for values that would not round-trip (e.g. NaN).
+    """
+    text = repr(value)
+    try:
+        same = ast.literal_eval(text) == value
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        same = False
+    if not same:
+        raise ValueError(f"value does not round-trip through repr: {text[:80]}")
+    return text
+
+
+class SeasonData:
+    """
+    One season's contestants and voting history in integer-coded form.
+
+    Arrays:
+        episodes, days, tribes, eliminated: one entry per tribal council
+        vote_offsets: vote rows for tribal council i are vote_offsets[i]:vote_offsets[i + 1]
+        voters, targets: one entry per vote, as indexes into names
+        contestant_ids: SEASON_CONTESTANTS as indexes into names
+        round_offsets: rounds of tribal council i are round_offsets[i]:round_offsets[i + 1]
+        round_kinds, round_eliminated: one entry per round (round_kinds index ROUND_KINDS)
+        round_vote_offsets, round_voters, round_targets, round_nullified: one entry per round vote
+    Councils without a "rounds" list take no round rows at all.
+    Days that are not integers (e.g. "TBD") and any extra tribal council keys
+    are kept in council_extras, and council_keys records each council's keys in
+    their original order. NO_VALUE marks a missing or None value.
+    """
+
+    ARRAYS = ('contestant_ids', 'episodes', 'days', 'tribes', 'eliminated',
+              'vote_offsets', 'voters', 'targets',
+              'round_offsets', 'round_kinds', 'round_eliminated',
+              'round_vote_offsets', 'round_voters', 'round_targets', 'round_nullified')
+
+    def __init__(self, season, names, tribe_names, arrays, council_keys, council_extras, extras,
+                 has_contestants=True, has_voting_history=True, round_keys=None):
+        self.season = season
+        self.names = names
+        self.tribe_names = tribe_names
+        for key in self.ARRAYS:
+            setattr(self, key, arrays[key])
+        self.council_keys = council_keys
+        self.council_extras = council_extras
+        self.round_keys = round_keys if round_keys is not None else [[] for _ in council_keys]
+        self.extras = extras
+        self.has_contestants = has_contestants
+        self.has_voting_history = has_voting_history
+        self._voting_history = None
+
+    @classmethod
+    def from_lists(cls, season, contestants, voting_history, extras=None):
+        """Normalize a contestants list and voting history into compact arrays."""
+        names, name_ids = [], {}
+        tribe_names, tribe_ids = [], {}
+
+        def code(value, table, ids):
+            if value is None:
+                return NO_VALUE
+            if value not in ids:
+                ids[value] = len(table)
+                table.append(value)
+            return ids[value]
+
+        contestant_ids = [code(c, names, name_ids) for c in contestants or []]
+
+        episodes, days, tribes, eliminated = [], [], [], []
+        vote_offsets, voters, targets = [0], [], []
+        council_keys, council_extras = [], []
+        round_offsets, round_kinds, round_eliminated = [0], [], []
+        round_vote_offsets, round_voters, round_targets, round_nullified = [0], [], [], []
+        round_keys = []
+        for tribal_council in voting_history or []:
+            extra = {k: v for k, v in tribal_council.items() if k not in CORE_KEYS}
+            episodes.append(tribal_council.get('episode', NO_VALUE))
+
+            day = tribal_council.get('day')
+            if isinstance(day, int) and not isinstance(day, bool):
+                days.append(day)
+            else:
+                days.append(NO_VALUE)
+                if 'day' in tribal_council:
+                    extra['day'] = day
+
+            tribes.append(code(tribal_council.get('tribe'), tribe_names, tribe_ids))
+            eliminated.append(code(tribal_council.get('eliminated'), names, name_ids))
+
+            for voter, target in tribal_council.get('votes', {}).items():
+                voters.append(code(voter, names, name_ids))
+                targets.append(code(target, names, name_ids))
+            vote_offsets.append(len(voters))
+
+            council_round_keys = []
+            for voting_round in tribal_council.get('rounds', []):
+                unknown = set(voting_round) - set(ROUND_KEYS)
+                if unknown:
+                    raise ValueError(f"Season {season}: unsupported round key(s) {sorted(unknown)}")
+                kind = voting_round.get('round', 'original')
+                if kind not in ROUND_KINDS:
+                    raise ValueError(f"Season {season}: unknown round kind {kind!r} (expected one of {ROUND_KINDS})")
+                round_kinds.append(ROUND_KINDS.index(kind))
+                round_eliminated.append(code(voting_round.get('eliminated'), names, name_ids))
+                nullified = set(voting_round.get('nullified', []))
+                for voter, target in voting_round.get('votes', {}).items():
+                    round_voters.append(code(voter, names, name_ids))
+                    round_targets.append(code(target, names, name_ids))
+                    round_nullified.append(voter in nullified)
+                round_vote_offsets.append(len(round_voters))
+                council_round_keys.append(list(voting_round.keys()))
+            round_offsets.append(len(round_kinds))
+            round_keys.append(council_round_keys)
+
+            council_keys.append(list(tribal_council.keys()))
+            council_extras.append(extra)
+
+        arrays = {
+            'contestant_ids': np.array(contestant_ids, dtype=np.int32),
+            'episodes': np.array(episodes, dtype=np.int32),
+            'days': np.array(days, dtype=np.int32),
+            'tribes': np.array(tribes, dtype=np.int32),
+            'eliminated': np.array(eliminated, dtype=np.int32),
+            'vote_offsets': np.array(vote_offsets, dtype=np.int32),
+            'voters': np.array(voters, dtype=np.int32),
+            'targets': np.array(targets, dtype=np.int32),
+            'round_offsets': np.array(round_offsets, dtype=np.int32),
+            'round_kinds': np.array(round_kinds, dtype=np.int8),
+            'round_eliminated': np.array(round_eliminated, dtype=np.int32),
+            'round_vote_offsets': np.array(round_vote_offsets, dtype=np.int32),
+            'round_voters': np.array(round_voters, dtype=np.int32),
+            'round_targets': np.array(round_targets, dtype=np.int32),
+            'round_nullified': np.array(round_nullified, dtype=bool),
+        }
+        return cls(season, names, tribe_names, arrays, council_keys, council_extras, extras or {},
+                   has_contestants=contestants is not None,
+                   has_voting_history=voting_history is not None,
+                   round_keys=round_keys)
+
+    @property
+    def contestants(self):
+        """SEASON_CONTESTANTS as a list of names (None if the file has no list)."""
+        if not self.has_contestants:
+            return None
+        return [lookup(i, self.names) for i in self.contestant_ids.tolist()]
+
+    @property
+    def voting_history(self):
+        """SEASON_VOTING_HISTORY rebuilt as a list of dictionaries (None if missing)."""
+        if not self.has_voting_history:
+            return None
+        if self._voting_history is None:
+            self._voting_history = [self.tribal_council(i) for i in range(len(self.episodes))]
+        return self._voting_history
+
+    def tribal_council(self, i):
+        """Rebuild the i-th tribal council dictionary."""
+        names = self.names
+        start, end = self.vote_offsets[i], self.vote_offsets[i + 1]
+        values = {
+            'episode': None if self.episodes[i] == NO_VALUE else int(self.episodes[i]),
+            'day': None if self.days[i] == NO_VALUE else int(self.days[i]),
+            'tribe': lookup(self.tribes[i], self.tribe_names),
+            'eliminated': lookup(self.eliminated[i], names),
+            'votes': {
+                lookup(voter, names): lookup(target, names)
+                for voter, target in zip(self.voters[start:end].tolist(), self.targets[start:end].tolist())
+            },
+        }
+        if 'rounds' in self.council_keys[i]:
+            values['rounds'] = self.rounds(i)
+        values.update(self.council_extras[i])
+        return {key: values[key] for key in self.council_keys[i]}
+
+    def rounds(self, i):
+        """
+        Rebuild the "rounds" list of the i-th tribal council ([] if it has none).
+
+        Nullified voters are listed in the order their votes appear.
+        """
+        names = self.names
+        rebuilt = []
+        first_round = int(self.round_offsets[i])
+        for r, keys in enumerate(self.round_keys[i], first_round):
+            start, end = self.round_vote_offsets[r], self.round_vote_offsets[r + 1]
+            voters = self.round_voters[start:end].tolist()
+            values = {
+                'round': ROUND_KINDS[self.round_kinds[r]],
+                'votes': {lookup(v, names): lookup(t, names)
+                          for v, t in zip(voters, self.round_targets[start:end].tolist())},
+                'nullified': [lookup(v, names) for v, nullified in zip(voters, self.round_nullified[start:end].tolist())
+                              if nullified],
+                'eliminated': lookup(self.round_eliminated[r], names),
+            }
+            rebuilt.append({key: values[key] for key in keys})
+        return rebuilt
+
+    def starting_tribes(self, num_tribal_councils=4):
+        """Map each voter in the first few tribal councils to the tribe they first voted with."""
+        end = int(self.vote_offsets[min(num_tribal_councils, len(self.episodes))])
+        council_of_vote = np.repeat(np.arange(len(self.episodes)), np.diff(self.vote_offsets))[:end]
+        contestant_tribes = {}
+        for voter, tribe in zip(self.voters[:end].tolist(), self.tribes[council_of_vote].tolist()):
+            name = lookup(voter, self.names)
+            if name not in contestant_tribes:
+                contestant_tribes[name] = self.tribe_names[tribe] if tribe != NO_VALUE else 'Unknown'
+        return contestant_tribes
+
+    def save(self, path, source_mtime_ns, source_hash):
+        """Write the compact form to an .npz cache file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            'format': CACHE_FORMAT,
+            'season': self.season,
+            'source_mtime_ns': source_mtime_ns,
+            'source_hash': source_hash,
+            'has_contestants': self.has_contestants,
+            'has_voting_history': self.has_voting_history,
+            'council_keys': self.council_keys,
+            # Season file literals keep their tuples and non-string keys through repr, not JSON
+            'council_extras': literal_text(self.council_extras),
+            'round_keys': self.round_keys,
+            'extras': literal_text(self.extras),
+        }
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp.npz')
+        np.savez(tmp_path,
+                 header=np.array(json.dumps(header)),
+                 names=np.array(self.names, dtype=str),
+                 tribe_names=np.array(self.tribe_names, dtype=str),
+                 **{key: getattr(self, key) for key in self.ARRAYS})
+        # Parallel workers may build the same entry; the rename keeps readers from seeing half a file
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_cached(cls, path):
+        """Read a cache file, returning (SeasonData, header)."""
+        with np.load(path) as cached:
+            header = json.loads(str(cached['header']))
+            season_data = cls(header['season'], cached['names'].tolist(), cached['tribe_names'].tolist(),
+                              {key: cached[key] for key in cls.ARRAYS},
+                              header['council_keys'], ast.literal_eval(header['council_extras']),
+                              ast.literal_eval(header['extras']),
+                              has_contestants=header['has_contestants'],
+                              has_voting_history=header['has_voting_history'],
+                              round_keys=header['round_keys'])
+        return season_data, header
+
+
+def load_season(season_num, season_dir=SEASON_DIR, cache_dir=CACHE_DIR, version=DEFAULT_VERSION):
+    """
+    Load a season through the cache, returning SeasonData or None if there is no data file.
+
+    The season file is only parsed when its cache entry is missing or stale.
+    """
+    path = season_file(season_num, season_dir, version)
+    if not path.exists():
+        return None
+
+    cache_path = Path(cache_dir) / season_dir_name(season_num, version).with_suffix('.npz')
+    mtime_ns = path.stat().st_mtime_ns
+    source_hash = None
+
+    if cache_path.exists():
+        try:
+            season_data, header = SeasonData.load_cached(cache_path)
+        except (OSError, ValueError, KeyError, SyntaxError):
+            header = None
+        if header and header.get('format') == CACHE_FORMAT:
+            if header['source_mtime_ns'] == mtime_ns:
+                return season_data
+            source_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+            if header['source_hash'] == source_hash:
+                # Touched but not edited: refresh the stored mtime only
+                season_data.save(cache_path, mtime_ns, source_hash)
+                return season_data
+
+    if source_hash is None:
+        source_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+    contestants, voting_history, extras = read_season_module(season_num, path)
+    season_data = SeasonData.from_lists(season_num, contestants, voting_history, extras)
+    try:
+        season_data.save(cache_path, mtime_ns, source_hash)
+    except (OSError, TypeError, ValueError):
+        # Unwritable cache directory or extras that do not round-trip: still return the data
+        pass
+    return season_data
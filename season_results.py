@@ -0,0 +1,223 @@
+"""
+Compact Season Analysis Results
+Stores a season's analysis as an .npz file instead of indented JSON
+
+Layout of analysis_results.npz:
+    header       JSON string with the scalar fields (season, season_name,
+                 year, merge_episode, contestants, finalists, winner, ...)
+    names        player-name table
+    counts       upper triangle of the player x player votes-together matrix
+                 (uint16, row by row, diagonal excluded)
+    pair_order   upper-triangle indexes of every pair with a vote together,
+                 strongest first (ties keep the order the pairs first voted together)
+    min_votes    votes together needed for a strong alliance
+
+Strong alliances are not stored twice: they are the pairs with counts at or
+above min_votes. write_json() streams the analysis_results.json structure
+for the optional JSON export, and from_json_file() reads one back.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+import json_stream
+
+RESULTS_FILE = 'analysis_results.npz'
+JSON_FILE = 'analysis_results.json'
+
+
+def alignment_entry(player1, player2, votes_together):
+    """One pair as written in the JSON alignment lists."""
+    return {"player1": player1, "player2": player2, "votes_together": votes_together}
+
+
+def triangle_index(size, rows, cols):
+    """Position of (row, col) pairs (row < col) in a condensed upper triangle."""
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    return rows * size - rows * (rows + 1) // 2 + (cols - rows - 1)
+
+
+class SeasonResults:
+    """One season's analysis results in compact form."""
+
+    def __init__(self, header, names, counts, pair_order, min_votes=2):
+        self.header = header
+        self.names = list(names)
+        self.counts = counts
+        self.pair_order = pair_order
+        self.min_votes = min_votes
+
+    @classmethod
+    def from_alignments(cls, header, contestants, alignments, min_votes=2):
+        """
+        Build compact results from {(player1, player2): votes_together}.
+
+        Args:
+            header: Dictionary of scalar result fields
+            contestants: Names listed first in the player table
+            alignments: Pair counts in the order pairs first voted together
+            min_votes: Votes together needed for a strong alliance
+        """
+        names = list(dict.fromkeys(list(contestants) + [p for pair in alignments for p in pair]))
+        ids = {name: i for i, name in enumerate(names)}
+        size = len(names)
+
+        pairs = sorted(alignments.items(), key=lambda x: x[1], reverse=True)
+        first = np.array([ids[a] for (a, b), _ in pairs], dtype=np.int64)
+        second = np.array([ids[b] for (a, b), _ in pairs], dtype=np.int64)
+        rows, cols = np.minimum(first, second), np.maximum(first, second)
+        order = triangle_index(size, rows, cols)
+
+        counts = np.zeros(size * (size - 1) // 2, dtype=np.uint16)
+        counts[order] = [count for _, count in pairs]
+        index_dtype = np.uint16 if counts.size <= np.iinfo(np.uint16).max else np.uint32
+        return cls(header, names, counts, order.astype(index_dtype), min_votes)
+
+    @classmethod
+    def from_dict(cls, results, min_votes=2):
+        """Build compact results from an analysis_results.json dictionary."""
+        header = {k: v for k, v in results.items() if k not in ('all_alignments', 'strong_alliances')}
+        alignments = {
+            (a['player1'], a['player2']): a['votes_together'] for a in results.get('all_alignments', [])
+        }
+        return cls.from_alignments(header, results.get('contestants', []), alignments, min_votes)
+
+    @classmethod
+    def from_json_file(cls, path, min_votes=2):
+        """Read an analysis_results.json file, streaming its alignment list."""
+        header, alignments = {}, {}
+        with open(path, 'r') as f:
+            members = json_stream.iter_members(f, stream_arrays=('all_alignments', 'strong_alliances'))
+            for key, value in members:
+                if key == 'all_alignments':
+                    for a in value:
+                        alignments[a['player1'], a['player2']] = a['votes_together']
+                elif key != 'strong_alliances':
+                    header[key] = value
+        return cls.from_alignments(header, header.get('contestants', []), alignments, min_votes)
+
+    def save(self, path):
+        """Write the results to an .npz file."""
+        np.savez_compressed(
+            path,
+            header=np.array(json.dumps(self.header)),
+            names=np.array(self.names, dtype=str),
+            counts=self.counts,
+            pair_order=self.pair_order,
+            min_votes=self.min_votes,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Read results saved with save()."""
+        with np.load(path) as stored:
+            return cls(json.loads(str(stored['header'])), stored['names'].tolist(),
+                       stored['counts'], stored['pair_order'], int(stored['min_votes']))
+
+    def __getitem__(self, key):
+        return self.header[key]
+
+    def get(self, key, default=None):
+        return self.header.get(key, default)
+
+    def _pair_positions(self):
+        """Map each pair_order entry back to (row, col) player indexes."""
+        size = len(self.names)
+        rows, cols = np.triu_indices(size, 1)
+        order = self.pair_order.astype(np.int64)
+        return rows[order], cols[order]
+
+    def alignments(self, min_votes=1):
+        """Yield (player1, player2, votes_together) strongest first, names sorted within each pair."""
+        rows, cols = self._pair_positions()
+        counts = self.counts[self.pair_order.astype(np.int64)]
+        for row, col, count in zip(rows.tolist(), cols.tolist(), counts.tolist()):
+            if count >= min_votes:
+                player1, player2 = sorted([self.names[row], self.names[col]])
+                yield player1, player2, count
+
+    def strong_alliances(self):
+        """Yield the alignments with at least min_votes votes together."""
+        return self.alignments(self.min_votes)
+
+    @property
+    def num_alignments(self):
+        return len(self.pair_order)
+
+    @property
+    def num_strong_alliances(self):
+        return int(np.count_nonzero(self.counts >= self.min_votes))
+
+    def matrix(self):
+        """Return the full symmetric player x player votes-together matrix."""
+        size = len(self.names)
+        matrix = np.zeros((size, size), dtype=np.uint16)
+        rows, cols = np.triu_indices(size, 1)
+        matrix[rows, cols] = self.counts
+        matrix[cols, rows] = self.counts
+        return matrix
+
+    def content_hash(self):
+        """SHA-256 over the stored content (npz bytes carry write timestamps, so are not hashed)."""
+        digest = hashlib.sha256(json.dumps(self.header, sort_keys=True).encode('utf-8'))
+        digest.update(json.dumps(self.names).encode('utf-8'))
+        for array in (self.counts, self.pair_order):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update(str(self.min_votes).encode('utf-8'))
+        return digest.hexdigest()
+
+    def to_dict(self):
+        """Rebuild the analysis_results.json structure."""
+        results = dict(self.header)
+        results['all_alignments'] = [alignment_entry(*a) for a in self.alignments()]
+        results['strong_alliances'] = [alignment_entry(*a) for a in self.strong_alliances()]
+        return results
+
+    def write_json(self, path):
+        """Stream the analysis_results.json export, one pair at a time."""
+        results = dict(self.header)
+        results['all_alignments'] = (alignment_entry(*a) for a in self.alignments())
+        results['strong_alliances'] = (alignment_entry(*a) for a in self.strong_alliances())
+        with open(path, 'w') as f:
+            json_stream.dump(results, f, indent=2)
+
+
+def find_season_dirs(data_dir='data/seasons', versions=None):
+    """
+    Return [(version, season output directory)] for every analyzed season.
+
+    US results sit directly under data_dir; each other version has its own
+    subdirectory. versions limits the search to some versions.
+    """
+    data_dir = Path(data_dir)
+    partitions = [('US', data_dir)]
+    partitions += [(d.name, d) for d in sorted(data_dir.iterdir())
+                   if d.is_dir() and not d.name.startswith('season')] if data_dir.exists() else []
+
+    found = []
+    for version, partition in partitions:
+        if versions and version not in versions:
+            continue
+        for season_dir in sorted(partition.glob('season*')):
+            if (season_dir / RESULTS_FILE).exists() or (season_dir / JSON_FILE).exists():
+                found.append((version, season_dir))
+    return found
+
+
+def load_results(season_dir):
+    """
+    Load a season's results from a season output directory.
+
+    Reads analysis_results.npz, falling back to analysis_results.json from
+    older runs. Returns a SeasonResults, or None if the season has no results.
+    """
+    season_dir = Path(season_dir)
+    if (season_dir / RESULTS_FILE).exists():
+        return SeasonResults.load(season_dir / RESULTS_FILE)
+    if (season_dir / JSON_FILE).exists():
+        return SeasonResults.from_json_file(season_dir / JSON_FILE)
+    return None
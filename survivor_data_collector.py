@@ -9,7 +9,7 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import json
-from collections import defaultdict
+import alignment_engine
 
 def fetch_season_page(season_url):
     """Fetch the HTML content of a Survivor season wiki page."""
@@ -108,23 +108,7 @@ def calculate_vote_alignments(votes_data, players):
     Returns:
         - alignment_matrix: Dictionary of player pairs and their vote alignment count
     """
-    alignment_counts = defaultdict(int)
-    
-    for voting_round in votes_data:
-        votes = voting_round['votes']
-        
-        # For each pair of players who both voted in this round
-        voters = list(votes.keys())
-        
-        for i, voter1 in enumerate(voters):
-            for voter2 in voters[i+1:]:
-                # Check if they voted for the same person
-                if votes[voter1] == votes[voter2]:
-                    # Create a sorted tuple as key (so order doesn't matter)
-                    pair = tuple(sorted([voter1, voter2]))
-                    alignment_counts[pair] += 1
-    
-    return alignment_counts
+    return alignment_engine.calculate_vote_alignments(votes_data)
 
 def identify_finalists(soup):
     """
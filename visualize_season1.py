@@ -9,6 +9,8 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from pathlib import Path
+from layout_cache import cached_layout
+import plotly_edges
 
 def load_data(filepath='season1_analysis_results.json'):
     """Load the analysis results from JSON file."""
@@ -61,7 +63,7 @@ def visualize_matplotlib(G, data, output_dir='visualizations'):
     fig, ax = plt.subplots(figsize=(16, 12))
 
     # Use spring layout for force-directed positioning
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    pos = cached_layout(G, k=2, iterations=50, seed=42)
 
     # Prepare node colors and sizes
     node_colors = []
@@ -197,30 +199,17 @@ def visualize_plotly(G, data, output_dir='visualizations'):
     Path(output_dir).mkdir(exist_ok=True)
 
     # Use spring layout (same as matplotlib for consistency)
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
-
-    # Create edge traces
-    edge_traces = []
-
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        weight = G[edge[0]][edge[1]]['weight']
-
-        # Edge line
-        edge_trace = go.Scatter(
-            x=[x0, x1, None],
-            y=[y0, y1, None],
-            mode='lines',
-            line=dict(
-                width=1 + (weight / 13) * 9,  # 13 is max votes
-                color=f'rgba(100, 150, 200, {0.3 + (weight / 13) * 0.6})'
-            ),
-            hoverinfo='text',
-            text=f'{edge[0]} ↔ {edge[1]}: {weight} votes together',
-            showlegend=False
-        )
-        edge_traces.append(edge_trace)
+    pos = cached_layout(G, k=2, iterations=50, seed=42)
+
+    # Create edge traces: one per weight, hover text on invisible midpoint markers
+    edge_traces = plotly_edges.edge_traces(
+        G, pos,
+        line_style=lambda weight: dict(
+            width=1 + (weight / 13) * 9,  # 13 is max votes
+            color=f'rgba(100, 150, 200, {0.3 + (weight / 13) * 0.6})'
+        ),
+        hover_text=lambda player1, player2, weight: f'{player1} ↔ {player2}: {weight} votes together'
+    )
 
     # Create node trace
     node_x = []
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Columnar Vote Corpus for All Seasons
+Stores every vote in one set of memory-mapped NumPy columns
+
+Layout (data/corpus/):
+    <column>.npy   one file per column, one row per vote, sorted by season
+    strings.json   shared string table for player and tribe names, plus
+                   the row range of every season
+
+Columns are opened with mmap_mode='r', so loading takes milliseconds and
+slicing a season returns views into the mapped files without copying.
+
+Usage:
+    python vote_corpus.py                  # Build from season files 1-30
+    python vote_corpus.py --range 1 20
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+
+from season_loader import load_season, NO_VALUE
+
+CORPUS_DIR = Path('data') / 'corpus'
+
+COLUMNS = {
+    'season': np.int16,
+    'council': np.int32,      # Global tribal council number, so votes can be grouped per council
+    'episode': np.int16,
+    'day': np.int16,
+    'tribe': np.int32,
+    'voter': np.int32,
+    'target': np.int32,
+    'eliminated': np.int32,
+}
+
+
+def build_corpus(season_nums, output_dir=CORPUS_DIR):
+    """Build the corpus from seasonN_manual_data.py files; returns the seasons included."""
+    strings, string_ids = [], {}
+
+    def intern(value):
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    columns = {name: [] for name in COLUMNS}
+    season_rows = {}
+    council_offset = 0
+
+    for season_num in sorted(season_nums):
+        season_data = load_season(season_num)
+        if season_data is None or not season_data.has_voting_history:
+            continue
+
+        # Map the season's local string codes onto the shared table
+        name_map = np.array([intern(n) for n in season_data.names] + [NO_VALUE], dtype=np.int32)
+        tribe_map = np.array([intern(t) for t in season_data.tribe_names] + [NO_VALUE], dtype=np.int32)
+
+        votes_per_council = np.diff(season_data.vote_offsets)
+        council = np.repeat(np.arange(len(votes_per_council)), votes_per_council)
+        start = sum(len(c) for c in columns['season'])
+
+        columns['season'].append(np.full(council.size, season_num))
+        columns['council'].append(council + council_offset)
+        columns['episode'].append(season_data.episodes[council])
+        columns['day'].append(season_data.days[council])
+        # NO_VALUE (-1) indexes the trailing NO_VALUE entry of each map
+        columns['tribe'].append(tribe_map[season_data.tribes[council]])
+        columns['voter'].append(name_map[season_data.voters])
+        columns['target'].append(name_map[season_data.targets])
+        columns['eliminated'].append(name_map[season_data.eliminated[council]])
+
+        season_rows[season_num] = [start, start + int(council.size)]
+        council_offset += len(votes_per_council)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, dtype in COLUMNS.items():
+        parts = columns[name]
+        column = np.concatenate(parts).astype(dtype) if parts else np.empty(0, dtype=dtype)
+        np.save(output_dir / f"{name}.npy", column)
+
+    with open(output_dir / 'strings.json', 'w') as f:
+        json.dump({'strings': strings, 'seasons': season_rows}, f)
+
+    return sorted(season_rows)
+
+
+class VoteCorpus:
+    """Memory-mapped view of the columnar vote corpus."""
+
+    def __init__(self, corpus_dir=CORPUS_DIR):
+        corpus_dir = Path(corpus_dir)
+        with open(corpus_dir / 'strings.json', 'r') as f:
+            header = json.load(f)
+        self.strings = header['strings']
+        self.season_rows = {int(k): tuple(v) for k, v in header['seasons'].items()}
+        self.columns = {
+            name: np.load(corpus_dir / f"{name}.npy", mmap_mode='r')
+            for name in COLUMNS
+        }
+        self._string_ids = None
+
+    def __len__(self):
+        return len(self.columns['season'])
+
+    @property
+    def seasons(self):
+        return sorted(self.season_rows)
+
+    def string_id(self, value):
+        """Return the code for a name in the string table (NO_VALUE if absent)."""
+        if self._string_ids is None:
+            self._string_ids = {s: i for i, s in enumerate(self.strings)}
+        return self._string_ids.get(value, NO_VALUE)
+
+    def season(self, season_num):
+        """Return {column: view} for one season's votes (no copies)."""
+        start, end = self.season_rows.get(season_num, (0, 0))
+        return {name: column[start:end] for name, column in self.columns.items()}
+
+    def votes_received(self, season_num):
+        """Return {player: votes received} for a season."""
+        targets = np.asarray(self.season(season_num)['target'])
+        targets = targets[targets != NO_VALUE]  # Votes with no recorded target
+        counts = np.bincount(targets, minlength=len(self.strings))
+        return {self.strings[i]: int(counts[i]) for i in np.nonzero(counts)[0]}
+
+    def co_vote_pairs(self, season_num, before_episode=None):
+        """
+        Return (voter_a, voter_b) code arrays for every pair that voted together.
+
+        Votes are grouped by (council, target) with a single sort; each group
+        of k voters contributes its C(k, 2) pairs.
+        """
+        rows = self.season(season_num)
+        keep = slice(None)
+        if before_episode is not None:
+            keep = np.asarray(rows['episode']) < before_episode
+        council = np.asarray(rows['council'])[keep]
+        target = np.asarray(rows['target'])[keep]
+        voter = np.asarray(rows['voter'])[keep]
+
+        order = np.lexsort((target, council))
+        council, target, voter = council[order], target[order], voter[order]
+        boundaries = np.flatnonzero((np.diff(council) != 0) | (np.diff(target) != 0)) + 1
+        first, second = [], []
+        for group in np.split(voter, boundaries):
+            if group.size > 1:
+                a, b = np.triu_indices(group.size, 1)
+                first.append(group[a])
+                second.append(group[b])
+        if not first:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty
+        return np.concatenate(first), np.concatenate(second)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the columnar vote corpus")
+    parser.add_argument("--range", nargs=2, type=int, default=[1, 30], metavar=("START", "END"),
+                        help="Season files to include (default: 1-30)")
+    parser.add_argument("--output", default=str(CORPUS_DIR), help=f"Output directory (default: {CORPUS_DIR})")
+    args = parser.parse_args()
+
+    seasons = build_corpus(range(args.range[0], args.range[1] + 1), args.output)
+    corpus = VoteCorpus(args.output)
+    size = sum(column.nbytes for column in corpus.columns.values())
+    print(f"✓ Built corpus for {len(seasons)} season(s): {len(corpus)} votes, {size / 1024:.1f} KB in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
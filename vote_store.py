@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+SQLite Vote Store for All Seasons
+Optional indexed database of seasons, contestants, tribal councils and votes
+
+Built from the seasonN_manual_data.py files (through season_loader) and/or
+the survivoR CSV exports read by convert_csv_to_python.py.
+
+Usage:
+    python vote_store.py                                   # Import season files 1-30
+    python vote_store.py --csv seasons_21-25_premerge_votes.csv
+    python vote_store.py --query finalist-votes            # Example indexed query
+"""
+
+import argparse
+import csv
+import itertools
+import sqlite3
+from pathlib import Path
+
+from season_metadata import SEASONS_METADATA, registry
+from season_loader import load_season
+
+DB_PATH = Path('data') / 'survivor_votes.db'
+
+# Bump when the schema changes; older databases are rebuilt since they only hold derived data
+SCHEMA_VERSION = 3
+
+# Rows per executemany batch when streaming a CSV export
+CHUNK_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    version TEXT NOT NULL DEFAULT 'US',
+    season INTEGER NOT NULL,
+    name TEXT,
+    year INTEGER,
+    location TEXT,
+    url TEXT,
+    merge_episode INTEGER,
+    episodes INTEGER,
+    contestants INTEGER,
+    winner TEXT,
+    tribe_merge_name TEXT,
+    PRIMARY KEY (version, season)
+);
+
+CREATE TABLE IF NOT EXISTS finalists (
+    version TEXT NOT NULL DEFAULT 'US',
+    season INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (version, season, name)
+);
+
+CREATE TABLE IF NOT EXISTS contestants (
+    version TEXT NOT NULL DEFAULT 'US',
+    season INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    elimination_order INTEGER,
+    PRIMARY KEY (version, season, name)
+);
+
+CREATE TABLE IF NOT EXISTS tribal_councils (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL DEFAULT 'US',
+    season INTEGER NOT NULL,
+    council_order INTEGER NOT NULL,
+    episode INTEGER,
+    day TEXT,
+    tribe TEXT,
+    eliminated TEXT,
+    quit INTEGER NOT NULL DEFAULT 0,
+    medevac INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS votes (
+    tribal_council_id INTEGER NOT NULL REFERENCES tribal_councils(id),
+    version TEXT NOT NULL DEFAULT 'US',
+    season INTEGER NOT NULL,
+    episode INTEGER,
+    voter TEXT NOT NULL,
+    target TEXT NOT NULL,
+    round INTEGER NOT NULL DEFAULT 0,       -- 0 = original vote, 1 = first revote, ...
+    nullified INTEGER NOT NULL DEFAULT 0,   -- Vote cancelled by a hidden immunity idol
+    final INTEGER NOT NULL DEFAULT 1        -- Vote belongs to the round that decided the council
+);
+
+CREATE INDEX IF NOT EXISTS idx_tribal_councils_season_episode ON tribal_councils(version, season, episode);
+CREATE INDEX IF NOT EXISTS idx_votes_tribal_council_round ON votes(tribal_council_id, round);
+CREATE INDEX IF NOT EXISTS idx_votes_season_episode ON votes(version, season, episode);
+CREATE INDEX IF NOT EXISTS idx_votes_season_voter ON votes(version, season, voter);
+CREATE INDEX IF NOT EXISTS idx_votes_season_target ON votes(version, season, target);
+"""
+
+TABLES = ('votes', 'tribal_councils', 'contestants', 'finalists', 'seasons')
+
+QUERIES = {
+    # Every deciding vote cast by a player who later sat at Final Tribal Council
+    'finalist-votes': """
+        SELECT v.version, v.season, v.episode, v.voter, v.target
+        FROM votes v
+        JOIN finalists f ON f.version = v.version AND f.season = v.season AND f.name = v.voter
+        WHERE v.final = 1
+        ORDER BY v.version, v.season, v.episode, v.voter
+    """,
+    # How often each player was voted for (deciding rounds only)
+    'votes-received': """
+        SELECT version, season, target, COUNT(*) AS votes_received
+        FROM votes
+        WHERE final = 1
+        GROUP BY version, season, target
+        ORDER BY version, season, votes_received DESC
+    """,
+    # Tribal councils that needed more than one round of voting
+    'revotes': """
+        SELECT t.version, t.season, t.episode, t.tribe, COUNT(DISTINCT v.round) AS rounds
+        FROM tribal_councils t
+        JOIN votes v ON v.tribal_council_id = t.id
+        GROUP BY t.id
+        HAVING rounds > 1
+        ORDER BY t.version, t.season, t.episode
+    """,
+}
+
+VOTE_COLUMNS = "(tribal_council_id, version, season, episode, voter, target, round, nullified, final)"
+
+
+def connect(db_path=DB_PATH):
+    """Open the vote store, creating (or rebuilding an outdated) schema if needed."""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        for table in TABLES:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def import_metadata(conn, metadata=SEASONS_METADATA, version='US'):
+    """Insert or replace the seasons and finalists tables from season metadata."""
+    for season_num, info in metadata.items():
+        conn.execute(
+            "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (version, season_num, info.get('name'), info.get('year'), info.get('location'), info.get('url'),
+             info.get('merge_episode'), info.get('episodes'), info.get('contestants'),
+             info.get('winner'), info.get('tribe_merge_name'))
+        )
+        conn.execute("DELETE FROM finalists WHERE version = ? AND season = ?", (version, season_num))
+        conn.executemany("INSERT INTO finalists VALUES (?, ?, ?)",
+                         [(version, season_num, name) for name in info.get('finalists', [])])
+
+
+def clear_season(conn, version, season_num):
+    """Remove a season's contestants, tribal councils and votes before re-importing it."""
+    for table in ('votes', 'tribal_councils', 'contestants'):
+        conn.execute(f"DELETE FROM {table} WHERE version = ? AND season = ?", (version, season_num))
+
+
+def insert_tribal_council(conn, version, season_num, council_order, tribal_council):
+    """Insert one tribal council dictionary and its votes (every round when "rounds" is present)."""
+    episode = tribal_council.get('episode')
+    cursor = conn.execute(
+        "INSERT INTO tribal_councils (version, season, council_order, episode, day, tribe, eliminated, quit, medevac) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (version, season_num, council_order, episode, tribal_council.get('day'), tribal_council.get('tribe'),
+         tribal_council.get('eliminated'), int(bool(tribal_council.get('quit'))),
+         int(bool(tribal_council.get('medevac') or tribal_council.get('evacuated'))))
+    )
+    rounds = tribal_council.get('rounds')
+    if not rounds:
+        rounds = [{'votes': tribal_council.get('votes', {})}]
+    # The deciding round is the last one with votes (a rock draw has none)
+    final_round = max((r for r, voting_round in enumerate(rounds) if voting_round.get('votes')), default=0)
+
+    rows = []
+    for round_num, voting_round in enumerate(rounds):
+        nullified = set(voting_round.get('nullified', []))
+        rows.extend(
+            (cursor.lastrowid, version, season_num, episode, voter, target,
+             round_num, int(voter in nullified), int(round_num == final_round))
+            for voter, target in voting_round.get('votes', {}).items()
+        )
+    conn.executemany(f"INSERT INTO votes {VOTE_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def import_season_files(conn, season_nums, version='US'):
+    """Import seasonN_manual_data.py files; returns the seasons that were found."""
+    imported = []
+    for season_num in season_nums:
+        season_data = load_season(season_num, version=version)
+        if season_data is None or not season_data.voting_history:
+            continue
+
+        clear_season(conn, version, season_num)
+        conn.executemany(
+            "INSERT OR IGNORE INTO contestants VALUES (?, ?, ?, ?)",
+            [(version, season_num, name, order) for order, name in enumerate(season_data.contestants or [], 1)]
+        )
+        for council_order, tribal_council in enumerate(season_data.voting_history):
+            insert_tribal_council(conn, version, season_num, council_order, tribal_council)
+        imported.append(season_num)
+    return imported
+
+
+def import_csv(conn, csv_path, chunk_size=CHUNK_SIZE):
+    """
+    Stream a survivoR vote_history CSV export into the store.
+
+    Handles both the filtered export from extract_voting_data.R and the full
+    all-versions export. Rows without a version column are treated as US.
+    The file is read chunk_size rows at a time and each chunk is written with
+    executemany, so memory use does not grow with the size of the file.
+
+    Rows are grouped into one tribal council per (version, season, episode,
+    tribe, order), so a double boot in one episode gives two councils. Every
+    voting round is kept: vote_order becomes the round number and the
+    nullified column is stored, then the last round of each council is
+    marked final. Seasons present in the file replace any rows already stored.
+
+    Returns the sorted list of (version, season) keys imported.
+    """
+    councils = {}
+    # Councils imported so far per (version, season): the next council_order
+    seen_seasons = {}
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.DictReader(f)
+        while True:
+            chunk = list(itertools.islice(reader, chunk_size))
+            if not chunk:
+                break
+
+            votes, contestants = [], set()
+            for row in chunk:
+                version = row.get('version') or 'US'
+                season_num = int(row['season'])
+                if (version, season_num) not in seen_seasons:
+                    clear_season(conn, version, season_num)
+                    seen_seasons[(version, season_num)] = 0
+                    if row.get('season_name'):
+                        conn.execute("INSERT OR IGNORE INTO seasons (version, season, name) VALUES (?, ?, ?)",
+                                     (version, season_num, row['season_name']))
+
+                episode = int(row['episode']) if row.get('episode') not in (None, '', 'NA') else None
+                key = (version, season_num, episode, row.get('tribe'), row.get('order'))
+                council_id = councils.get(key)
+                if council_id is None:
+                    cursor = conn.execute(
+                        "INSERT INTO tribal_councils (version, season, council_order, episode, day, tribe, eliminated) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (version, season_num, seen_seasons[(version, season_num)], episode, row.get('day'),
+                         row.get('tribe'), row.get('voted_out'))
+                    )
+                    council_id = councils[key] = cursor.lastrowid
+                    seen_seasons[(version, season_num)] += 1
+
+                voter, target = row.get('castaway'), row.get('vote')
+                if voter:
+                    contestants.add((version, season_num, voter))
+                if voter and target and target != 'NA':
+                    round_num = int(row['vote_order']) - 1 if row.get('vote_order') not in (None, '', 'NA') else 0
+                    nullified = int((row.get('nullified') or '').upper() == 'TRUE')
+                    votes.append((council_id, version, season_num, episode, voter, target, round_num, nullified, 0))
+
+            conn.executemany("INSERT OR IGNORE INTO contestants (version, season, name) VALUES (?, ?, ?)",
+                             sorted(contestants))
+            conn.executemany(f"INSERT INTO votes {VOTE_COLUMNS} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", votes)
+
+    # Rounds can span chunks, so the deciding round is only known once the file is read
+    conn.executemany(
+        "UPDATE votes SET final = (round = (SELECT MAX(round) FROM votes v WHERE v.tribal_council_id = votes.tribal_council_id)) "
+        "WHERE version = ? AND season = ?",
+        sorted(seen_seasons)
+    )
+    return sorted(seen_seasons)
+
+
+def run_query(conn, name):
+    """Run one of the named example QUERIES and return its rows."""
+    return conn.execute(QUERIES[name]).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the SQLite vote store")
+    parser.add_argument("--db", default=str(DB_PATH), help=f"Database path (default: {DB_PATH})")
+    parser.add_argument("--range", nargs=2, type=int, default=[1, 30], metavar=("START", "END"),
+                        help="Season files to import (default: 1-30)")
+    parser.add_argument("--version", action="append", dest="versions", metavar="VERSION",
+                        help="survivoR version of the season files to import (repeatable; default: US)")
+    parser.add_argument("--csv", help="Also import a survivoR vote_history CSV export")
+    parser.add_argument("--query", choices=sorted(QUERIES), help="Run a named query instead of importing")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+
+    if args.query:
+        for row in run_query(conn, args.query):
+            print(" | ".join(str(value) for value in row))
+        return
+
+    with conn:
+        for version in args.versions or ['US']:
+            import_metadata(conn, registry.version(version).seasons, version)
+            imported = import_season_files(conn, range(args.range[0], args.range[1] + 1), version)
+            print(f"✓ Imported {len(imported)} {version} season file(s)")
+        if args.csv:
+            csv_seasons = import_csv(conn, args.csv)
+            print(f"✓ Imported {len(csv_seasons)} season(s) from {args.csv}")
+
+    votes = conn.execute("SELECT COUNT(*) FROM votes").fetchone()[0]
+    print(f"✓ Vote store: {args.db} ({votes} votes)")
+
+
+if __name__ == "__main__":
+    main()
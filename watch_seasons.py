@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Watch Mode for Manual Data Entry
+Re-validates, re-analyzes and re-renders a season as soon as its file is saved
+
+Watches seasonN_manual_data.py files (and versions/<VERSION>/ files) plus the
+season metadata in data/metadata/*.json. When a file changes, only the
+affected season is rebuilt:
+
+    1. validate (scripts/validate_season_data.py checks, US seasons)
+    2. analyze  (batch_analyze.process_season)
+    3. render   (batch_visualize.visualize_season)
+
+matplotlib, plotly and networkx are imported once when the watcher starts,
+so each rebuild skips the interpreter and import start-up of a batch run.
+Rebuilt seasons are recorded in the build manifest and results archive, and
+index.html is regenerated, so the next batch_analyze.py run skips them. The
+300-dpi print image is skipped (and any older one removed) unless
+--print-format asks for it, so a rebuild only draws the web and thumbnail
+tiers that index.html shows; the next batch_visualize.py run renders those
+seasons again unless it uses the same --print-format. The seasons
+comparison chart is left to the next batch_visualize.py run.
+
+Usage:
+    python watch_seasons.py                    # Watch every version with metadata
+    python watch_seasons.py --version US       # Only US seasons
+    python watch_seasons.py --interval 0.5     # Poll every half second
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import batch_analyze
+import batch_visualize
+import build_manifest
+import dashboard
+import image_tiers
+import results_archive
+import season_loader
+from season_metadata import DEFAULT_VERSION, METADATA_DIR, registry, season_key, season_label
+from season_results import load_results
+
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from validate_season_data import validate_season_data
+
+# Wait this long after a change is seen so an editor can finish writing the file
+SETTLE_SECONDS = 0.05
+
+
+def watched_files(versions):
+    """Return {path: ('season', version, season_num) or ('metadata', version)} to poll."""
+    files = {}
+    for version in versions:
+        files[METADATA_DIR / f"{version}.json"] = ('metadata', version)
+        for _, season_num in registry.keys([version]):
+            files[season_loader.season_file(season_num, version=version)] = ('season', version, season_num)
+    return files
+
+
+def snapshot(files):
+    """Return {path: modification time in ns, or None if the file does not exist}."""
+    mtimes = {}
+    for path in files:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtimes[path] = None
+    return mtimes
+
+
+def changed_metadata_seasons(version):
+    """
+    Reload a version's metadata and return the seasons whose entries changed.
+
+    A file that does not parse (half-written, or a typo) leaves the previous
+    metadata in place and changes nothing; the next save is picked up as usual.
+    """
+    before = dict(registry.version(version).seasons)
+    try:
+        registry.reload(version)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f"\n✗ Could not read {METADATA_DIR / (version + '.json')}: {e}")
+        print(f"  Keeping the previous {version} metadata; fix the file and save again")
+        return []
+    after = registry.version(version).seasons
+    return [n for n in sorted(set(before) | set(after)) if before.get(n) != after.get(n)]
+
+
+def validate(season_num, version):
+    """Print validation findings; return False if any are errors."""
+    if version != DEFAULT_VERSION:
+        print("  ○ Validation covers US seasons only; skipping")
+        return True
+    errors = validate_season_data(season_num)
+    for error in errors:
+        print(f"  {error}")
+    if any(e.severity == "ERROR" for e in errors):
+        print("  ✗ Fix the errors above and save again")
+        return False
+    print(f"  ✓ Valid ({len(errors)} warning(s))")
+    return True
+
+
+def rebuild_season(season_num, version=DEFAULT_VERSION, print_format='none'):
+    """Validate, analyze and render one season, recording it in the manifest and archive."""
+    start = time.perf_counter()
+    label = season_label(season_num, version)
+    key = season_key(season_num, version)
+    print(f"\n🔄 {label} changed")
+
+    metadata = registry.get(season_num, version)
+    if metadata is None:
+        print(f"  ✗ {label} has no metadata in {METADATA_DIR / (version + '.json')}")
+        return
+    if not season_loader.season_file(season_num, version=version).exists():
+        print("  ○ No data file yet")
+        return
+    if not validate(season_num, version):
+        return
+
+    manifest = build_manifest.BuildManifest()
+    summary = batch_analyze.process_season(season_num, metadata, version=version)
+    if summary['status'] != 'success':
+        manifest.forget('analyze', key)
+        manifest.save()
+        return
+    manifest.record('analyze', key, batch_analyze.analysis_inputs(season_num, metadata, version=version),
+                    batch_analyze.analysis_outputs(season_num, version=version))
+
+    results = load_results(batch_analyze.season_output_dir(season_num, version))
+    render_options = {'standalone_html': False, 'print_format': print_format}
+    paths = batch_visualize.visualize_season(season_num, results, **render_options)
+    manifest.record('render', key,
+                    batch_visualize.render_inputs(season_num, results.content_hash(), version, **render_options),
+                    paths)
+    manifest.save()
+    dashboard.write_index(results_archive.build_archive())
+
+    print(f"✓ {label} rebuilt in {time.perf_counter() - start:.2f}s")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rebuild a season whenever its data or metadata is saved")
+    parser.add_argument(
+        "--version",
+        action="append",
+        dest="versions",
+        metavar="VERSION",
+        help="Only watch this survivoR version, e.g. US, AU (repeatable; default: every version with metadata)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.2,
+        metavar="SECONDS",
+        help="Seconds between checks for changed files (default: 0.2)"
+    )
+    parser.add_argument(
+        "--print-format",
+        choices=image_tiers.PRINT_FORMATS,
+        default="none",
+        help="Print-size image tier to redraw on each save: png (300 dpi), svg or none (default, fastest)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    versions = args.versions or registry.versions()
+    batch_visualize.load_renderers()
+
+    files = watched_files(versions)
+    seen = snapshot(files)
+    print(f"👀 Watching {len(files)} file(s) for {', '.join(versions)} (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = snapshot(files)
+            changed = [path for path in files if current[path] != seen[path]]
+            if not changed:
+                continue
+
+            time.sleep(SETTLE_SECONDS)
+            affected = []
+            for path in changed:
+                kind, version, *season = files[path]
+                if kind == 'metadata':
+                    affected += [(version, n) for n in changed_metadata_seasons(version)]
+                else:
+                    affected.append((version, season[0]))
+
+            # Metadata edits can add seasons, so refresh the watch list before snapshotting
+            if any(files[path][0] == 'metadata' for path in changed):
+                files = watched_files(versions)
+            seen = snapshot(files)
+
+            for version, season_num in dict.fromkeys(affected):
+                try:
+                    rebuild_season(season_num, version, args.print_format)
+                except Exception as e:
+                    # A broken season must not stop the watcher; the next save retries it
+                    print(f"✗ {season_label(season_num, version)} failed: {e}")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+if __name__ == "__main__":
+    main()